@@ -24,7 +24,7 @@ class Config:
     db_accounting: str
     
     # Access
-    allowed_editors: set[int]
+    allowed_editors: frozenset[int]
     mini_app_viewer_ids: set[int]
     mini_app_viewer_handles: set[str]
     crm_topic_thread_id: int
@@ -69,10 +69,10 @@ def _parse_mini_app_viewers(value: str) -> tuple[set[int], set[str]]:
     return ids, handles
 
 
-def _parse_user_ids(value: str) -> set[int]:
+def _parse_user_ids(value: str) -> frozenset[int]:
     """Parse comma-separated user IDs from env variable."""
     if not value:
-        return set()
+        return frozenset()
     result: set[int] = set()
     for item in value.split(","):
         item = item.strip()
@@ -82,7 +82,7 @@ def _parse_user_ids(value: str) -> set[int]:
             result.add(int(item))
         except ValueError:
             continue
-    return result
+    return frozenset(result)
 
 
 def _parse_google_service_account(value: str) -> dict | None:
@@ -26,6 +26,7 @@ flow and step match what the action expects. On mismatch the user sees
 "Сессия устарела, откройте модель заново" and (if possible) a stateless Back.
 """
 
+import asyncio
 import html
 import logging
 import time
@@ -95,6 +96,11 @@ _cd_in_progress: set[tuple[int, int]] = set()
 # within the TTL into one, silently dropping the later legitimate press.
 _CALLBACK_DEDUP_TTL = 5.0
 _callback_dedup: dict[str, float] = {}
+# (chat_id, user_id, callback_data) of presses currently being handled. Unlike
+# _callback_dedup this is not a time window: a key lives only while its handler
+# runs, so a double-tap that lands mid-fetch is coalesced into the first press,
+# while a later press of the same button (after the first finished) goes through.
+_inflight_callbacks: set[tuple[int, int, str]] = set()
 router.callback_query.filter(TopicAccessCallbackFilter())
 
 # Tracks the last (message_id, dedup_key) pair a user's callback
@@ -131,17 +137,17 @@ def _dedup_key(query: CallbackQuery) -> str:
     advanced the flow. Token-exempt actions (_NO_TOKEN_ACTIONS) have no
     such shared token, so fall back to the full callback_data.
     """
-    parts = query.data.split(":")
-    action = parts[1] if len(parts) > 1 else ""
+    action = query.data.partition(":")[2].partition(":")[0]
     if action in _NO_TOKEN_ACTIONS:
         return query.data
-    return parts[-1]
+    return query.data.rpartition(":")[2]
 
 
 def _state_ids_from_query(query: CallbackQuery) -> tuple[int, int]:
+    user_id = query.from_user.id
     if not query.message:
-        return query.from_user.id, query.from_user.id
-    return query.message.chat.id, query.from_user.id
+        return user_id, user_id
+    return query.message.chat.id, user_id
 
 SESSION_EXPIRED_MSG = "Сессия устарела, откройте модель заново"
 STALE_MSG = "Сессия устарела, откройте модель заново"
@@ -351,8 +357,16 @@ async def handle_nlp_callback(
     concurrently (see app.utils.locks for why).
     """
     chat_id, user_id = _state_ids_from_query(query)
-    async with get_user_lock(chat_id, user_id):
-        await _handle_nlp_callback_impl(query, config, notion, memory_state, recent_models)
+    inflight_key = (chat_id, user_id, query.data or "")
+    if inflight_key in _inflight_callbacks:
+        await safe_query_answer(query)
+        return
+    _inflight_callbacks.add(inflight_key)
+    try:
+        async with get_user_lock(chat_id, user_id):
+            await _handle_nlp_callback_impl(query, config, notion, memory_state, recent_models)
+    finally:
+        _inflight_callbacks.discard(inflight_key)
 
 
 async def _handle_nlp_callback_impl(
@@ -394,14 +408,15 @@ async def _handle_nlp_callback_impl(
     chat_id, user_id = _state_ids_from_query(query)
     state = memory_state.get(chat_id, user_id)
 
-    LOGGER.info(
-        "NLP callback: user=%s action=%s data=%s flow=%s step=%s model_id=%s order_type=%s",
-        user_id, action, query.data,
-        state.get("flow") if state else None,
-        state.get("step") if state else None,
-        state.get("model_id") if state else None,
-        state.get("order_type") if state else None,
-    )
+    if LOGGER.isEnabledFor(logging.INFO):
+        LOGGER.info(
+            "NLP callback: user=%s action=%s data=%s flow=%s step=%s model_id=%s order_type=%s",
+            user_id, action, query.data,
+            state.get("flow") if state else None,
+            state.get("step") if state else None,
+            state.get("model_id") if state else None,
+            state.get("order_type") if state else None,
+        )
 
     try:
         # ===== Cancel (always allowed) =====
@@ -578,8 +593,31 @@ async def _handle_select_model(query, parts, config, notion, memory_state, recen
     model_id = parts[2]
     chat_id, user_id = _state_ids_from_query(query)
 
-    # Get model info
-    model_data = await notion.get_model(model_id)
+    # Model lookup and card data are fetched concurrently
+    from app.keyboards.inline import model_card_keyboard, nlp_back_keyboard
+    from app.services.model_card import build_model_card_by_id, is_card_cached
+    card_coro = build_model_card_by_id(model_id, config, notion)
+    if is_card_cached(model_id):
+        model_data, card_text, open_orders = await card_coro
+    else:
+        # Cold card: show a placeholder while Notion is queried, so the tap
+        # gets visible feedback right away (the edit overlaps the fetch).
+        card_result, _ = await asyncio.gather(
+            card_coro,
+            safe_edit_message(query, "⏳ Загружаю…"),
+            return_exceptions=True,
+        )
+        if isinstance(card_result, BaseException):
+            # The placeholder already replaced the picker, so leave a way out
+            # instead of a keyboard-less "loading" message.
+            LOGGER.error("Failed to load model card %s", model_id, exc_info=card_result)
+            await safe_edit_message(
+                query,
+                "❌ Ошибка Notion — попробуй позже",
+                reply_markup=nlp_back_keyboard(model_id),
+            )
+            return
+        model_data, card_text, open_orders = card_result
     if not model_data:
         await query.message.edit_text("Модель не найдена.")
         return
@@ -588,8 +626,6 @@ async def _handle_select_model(query, parts, config, notion, memory_state, recen
     memory_state.clear(chat_id, user_id)
 
     # Show universal model card with live data
-    from app.keyboards.inline import model_card_keyboard
-    from app.services.model_card import build_model_card
     k = generate_token()
     memory_state.set(chat_id, user_id, {
         "flow": "nlp_actions",
@@ -597,9 +633,6 @@ async def _handle_select_model(query, parts, config, notion, memory_state, recen
         "model_name": model_data.title,
         "k": k,
     })
-    card_text, open_orders = await build_model_card(
-        model_id, model_data.title, config, notion,
-    )
     await _clear_previous_screen_keyboard(query, memory_state)
     msg = await safe_edit_message(
         query,
@@ -638,65 +671,65 @@ async def _handle_model_action(query, parts, config, notion, memory_state, recen
     model_id = state["model_id"]
     model_name = state.get("model_name", "")
 
-    if action == "order":
-        # Show order type selection
-        if not is_editor(user_id, config):
-            await query.message.edit_text("❌ Нет доступа")
-            return
-        from app.keyboards.inline import nlp_order_type_keyboard
-        k = generate_token()
-        memory_state.set(chat_id, user_id, {
-            "flow": "nlp_order",
-            "step": "awaiting_type",
-            "model_id": model_id,
-            "model_name": model_name,
-            "k": k,
-        })
-        await _clear_previous_screen_keyboard(query, memory_state)
-        msg = await query.message.edit_text(
-            f"📦 <b>{html.escape(model_name)}</b> · Тип заказа:",
-            reply_markup=nlp_order_type_keyboard(model_id, k),
-            parse_mode="HTML",
-        )
-        _remember_screen_message(
-            memory_state,
-            chat_id,
-            user_id,
-            msg.message_id if msg else query.message.message_id,
-            )
-
-    elif action == "files":
-        await _show_files_menu(query, config, notion, memory_state)
-
-    elif action == "shoot":
-        await _show_shoot_menu(query, config, notion, memory_state)
-
-    elif action == "report":
-        # Show report inline
-        k = generate_token()
-        memory_state.set(chat_id, user_id, {
-            "flow": "nlp_report",
-            "model_id": model_id,
-            "model_name": model_name,
-            "k": k,
-        })
-        await _show_report(query, model_id, model_name, config, notion, memory_state, k)
+    handler = _MODEL_ACTION_HANDLERS.get(action)
+    if handler is not None:
+        await handler(query, config, notion, memory_state, model_id, model_name)
 
-    elif action == "orders":
-        await _show_orders_menu(query, config, notion, memory_state)
 
-    elif action == "close":
-        await _show_close_picker(
-            query=query,
-            model_id=model_id,
-            model_name=model_name,
-            config=config,
-            notion=notion,
-            memory_state=memory_state,
+async def _start_order_flow(query, config, notion, memory_state, model_id, model_name):
+    """Show order type selection. Callback: nlp:act:order[:{k}]"""
+    chat_id, user_id = _state_ids_from_query(query)
+    if not is_editor(user_id, config):
+        await query.message.edit_text("❌ Нет доступа")
+        return
+    from app.keyboards.inline import nlp_order_type_keyboard
+    k = generate_token()
+    memory_state.set(chat_id, user_id, {
+        "flow": "nlp_order",
+        "step": "awaiting_type",
+        "model_id": model_id,
+        "model_name": model_name,
+        "k": k,
+    })
+    await _clear_previous_screen_keyboard(query, memory_state)
+    msg = await query.message.edit_text(
+        f"📦 <b>{html.escape(model_name)}</b> · Тип заказа:",
+        reply_markup=nlp_order_type_keyboard(model_id, k),
+        parse_mode="HTML",
+    )
+    _remember_screen_message(
+        memory_state,
+        chat_id,
+        user_id,
+        msg.message_id if msg else query.message.message_id,
         )
 
-    elif action == "note":
-        await _handle_note_action(query, config, memory_state)
+
+async def _start_report_flow(query, config, notion, memory_state, model_id, model_name):
+    """Show report inline. Callback: nlp:act:report[:{k}]"""
+    chat_id, user_id = _state_ids_from_query(query)
+    k = generate_token()
+    memory_state.set(chat_id, user_id, {
+        "flow": "nlp_report",
+        "model_id": model_id,
+        "model_name": model_name,
+        "k": k,
+    })
+    await _show_report(query, model_id, model_name, config, notion, memory_state, k)
+
+
+# Card menu action -> handler(query, config, notion, memory_state, model_id, model_name).
+_MODEL_ACTION_HANDLERS = {
+    "order": _start_order_flow,
+    "files": lambda q, c, n, m, mid, name: _show_files_menu(q, c, n, m),
+    "shoot": lambda q, c, n, m, mid, name: _show_shoot_menu(q, c, n, m),
+    "report": _start_report_flow,
+    "orders": lambda q, c, n, m, mid, name: _show_orders_menu(q, c, n, m),
+    "close": lambda q, c, n, m, mid, name: _show_close_picker(
+        query=q, model_id=mid, model_name=name, config=c, notion=n, memory_state=m,
+    ),
+    "note": lambda q, c, n, m, mid, name: _handle_note_action(q, c, m),
+}
 
 
 async def _handle_note_action(
@@ -2097,15 +2130,19 @@ async def _handle_report_orders(query, config, notion, memory_state):
         await safe_query_answer(query, "Нет открытых заказов", show_alert=True)
         return
 
-    model_data = await notion.get_model(model_id)
-    model_name = model_data.title if model_data else "модели"
+    # Report flow keeps model_name in state; only hit Notion for old sessions.
+    model_name = state.get("model_name")
+    if not model_name:
+        model_data = await notion.get_model(model_id)
+        model_name = model_data.title if model_data else "модели"
 
-    orders_text = "\n".join(
+    lines = [
         f"• {o.order_type or 'order'} · {_format_date_short(o.in_date)}"
         for o in orders[:10]
-    )
+    ]
     if len(orders) > 10:
-        orders_text += f"\n\n...и ещё {len(orders) - 10}"
+        lines.append(f"\n...и ещё {len(orders) - 10}")
+    orders_text = "\n".join(lines)
 
     k = generate_token()
     memory_state.update(chat_id, user_id, k=k)
@@ -2133,8 +2170,11 @@ async def _handle_report_accounting(query, config, notion, memory_state):
     yyyy_mm = now.strftime("%Y-%m")
     record = await accounting_cache.get_cached_monthly_record(notion, config, model_id, yyyy_mm)
 
-    model_data = await notion.get_model(model_id)
-    model_name = model_data.title if model_data else "модели"
+    # Report flow keeps model_name in state; only hit Notion for old sessions.
+    model_name = state.get("model_name")
+    if not model_name:
+        model_data = await notion.get_model(model_id)
+        model_name = model_data.title if model_data else "модели"
 
     if not record:
         accounting_text = f"Файлов: {format_accounting_progress(0, None)}"
@@ -2680,6 +2720,13 @@ async def _handle_accounting_content_save(query, parts, config, notion, memory_s
 #                              HELPERS
 # ============================================================================
 
+_REPORT_TMPL = (
+    "📊 <b>{name}</b> · {period}\n\n"
+    "📁 Файлов: {files}\n"
+    "📦 Заказов: {orders}\n"
+)
+
+
 async def _show_report(query, model_id, model_name, config, notion, memory_state, k=""):
     """Show inline report for model."""
     from app.keyboards.inline import nlp_report_keyboard
@@ -2689,14 +2736,14 @@ async def _show_report(query, model_id, model_name, config, notion, memory_state
     now = datetime.now(tz=config.timezone)
     yyyy_mm = now.strftime("%Y-%m")
 
-    try:
-        record = await accounting_cache.get_cached_monthly_record(notion, config, model_id, yyyy_mm)
-    except Exception:
+    record, open_orders = await asyncio.gather(
+        accounting_cache.get_cached_monthly_record(notion, config, model_id, yyyy_mm),
+        orders_cache.get_cached_orders(notion, config, model_id),
+        return_exceptions=True,
+    )
+    if isinstance(record, BaseException):
         record = None
-
-    try:
-        open_orders = await orders_cache.get_cached_orders(notion, config, model_id)
-    except Exception:
+    if isinstance(open_orders, BaseException):
         open_orders = []
 
     if record:
@@ -2708,10 +2755,14 @@ async def _show_report(query, model_id, model_name, config, notion, memory_state
     orders_str = f"{len(open_orders)} открытых"
 
     await _clear_previous_screen_keyboard(query, memory_state)
+    text = _REPORT_TMPL.format_map({
+        "name": escape_html(model_name),
+        "period": yyyy_mm,
+        "files": files_str,
+        "orders": orders_str,
+    })
     msg = await query.message.edit_text(
-        f"📊 <b>{escape_html(model_name)}</b> · {yyyy_mm}\n\n"
-        f"📁 Файлов: {files_str}\n"
-        f"📦 Заказов: {orders_str}\n",
+        text,
         reply_markup=nlp_report_keyboard(model_id, k),
         parse_mode="HTML",
     )
@@ -2779,7 +2830,7 @@ def _format_date_short(date_str: str | None) -> str:
         return "?"
     try:
         d = date.fromisoformat(date_str[:10])
-        return d.strftime("%d.%m")
+        return f"{d.day:02d}.{d.month:02d}"
     except (ValueError, TypeError):
         return "?"
 
@@ -13,7 +13,7 @@ from aiogram.types import Message
 from app.config import Config
 from app.roles import is_authorized
 from app.services import NotionClient, NotionAccounting, NotionPlanner, NotionOrder
-from app.utils.formatting import today
+from app.utils.formatting import MONTHS_EN_LOWER, today
 
 LOGGER = logging.getLogger(__name__)
 router = Router()
@@ -85,7 +85,7 @@ async def update_reddit_board(bot, config: Config, notion: NotionClient) -> None
 
     prev_accounting = None
     if config.archive_page_id:
-        month_name_en = prev_month_last_day.strftime("%B").lower()
+        month_name_en = MONTHS_EN_LOWER[prev_month_last_day.month - 1]
         try:
             archive_db_id = await notion.find_archive_accounting_db(config.archive_page_id, month_name_en)
             if archive_db_id:
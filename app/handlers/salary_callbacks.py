@@ -29,6 +29,9 @@ from app.utils.telegram import is_owner_callback, safe_edit_message, safe_query_
 
 LOGGER = logging.getLogger(__name__)
 router = Router()
+# Router-level prefix gate: foreign callbacks (mostly nlp:) are rejected with a
+# single check instead of running every handler's own filter.
+router.callback_query.filter(F.data.startswith("salary_"))
 
 
 async def _load_row(redis, notion: NotionClient, config: Config, yyyy_mm: str, model_id: str) -> ModelSalaryRow | None:
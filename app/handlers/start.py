@@ -7,6 +7,7 @@ from aiogram.types import Message, ReplyKeyboardRemove
 from app.config import Config
 from app.filters.topic_access import TopicAccessMessageFilter
 from app.roles import is_authorized
+from app.router.dispatcher import route_message
 from app.services import NotionClient
 from app.state import MemoryState, RecentModels
 
@@ -14,6 +15,17 @@ LOGGER = logging.getLogger(__name__)
 router = Router()
 router.message.filter(TopicAccessMessageFilter())
 
+# /start reply is static, so one text and one markup instance serve every call.
+_WELCOME_TEXT = (
+    "👋 Привет! Это бот для ведение моделей в Notion\n\n"
+    "📝 <b>Примеры команд:</b>\n"
+    "• три кастома клещ — бот создаст 3 заказа\n"
+    "• клещ 30 файлов — добавит файлы в учет месяца\n"
+    "• сьемка\шут клещ — создаст сьемку в планере\n"
+    "Просто пиши мне текстом! 🚀"
+)
+_REMOVE_KB = ReplyKeyboardRemove()
+
 
 @router.message(Command("start"))
 async def cmd_start(message: Message, config: Config) -> None:
@@ -32,16 +44,7 @@ async def cmd_start(message: Message, config: Config) -> None:
 
     LOGGER.info("User %s started bot", user_id)
 
-    await message.answer(
-        "👋 Привет! Это бот для ведение моделей в Notion\n\n"
-        "📝 <b>Примеры команд:</b>\n"
-        "• три кастома клещ — бот создаст 3 заказа\n"
-        "• клещ 30 файлов — добавит файлы в учет месяца\n"
-        "• сьемка\шут клещ — создаст сьемку в планере\n"
-        "Просто пиши мне текстом! 🚀",
-        reply_markup=ReplyKeyboardRemove(),
-        parse_mode="HTML",
-    )
+    await message.answer(_WELCOME_TEXT, reply_markup=_REMOVE_KB, parse_mode="HTML")
 
 
 # ==================== NLP Router ====================
@@ -56,16 +59,12 @@ async def handle_nlp_message(
 ) -> None:
     """Handle NLP text messages (router-based)."""
     user_id = message.from_user.id
-    LOGGER.info("TEXT_HANDLER HIT user=%s text=%r", user_id, message.text[:80])
+    if LOGGER.isEnabledFor(logging.INFO):
+        LOGGER.info("TEXT_HANDLER HIT user=%s text=%r", user_id, message.text[:80])
 
     if not is_authorized(user_id, config):
         LOGGER.warning("TEXT_HANDLER BLOCKED by is_authorized user=%s", user_id)
         return
 
-    text = (message.text or "").strip()
-
-    # Import router
-    from app.router import route_message
-
     # Route the message
     await route_message(message, config, notion, memory_state, recent_models)
@@ -7,6 +7,7 @@ token/state store to expire or lose across a Cloud Run restart.
 """
 import asyncio
 import logging
+import threading
 
 import requests
 from aiogram import F, Router
@@ -20,6 +21,22 @@ from app.utils.telegram import is_owner_callback, safe_edit_message, safe_query_
 
 LOGGER = logging.getLogger(__name__)
 router = Router()
+# Router-level prefix gate: foreign callbacks (mostly nlp:) are rejected with a
+# single check instead of running every handler's own filter.
+router.callback_query.filter(F.data.startswith("wml_"))
+
+# One WML session per worker thread: keeps the login cookie and keep-alive
+# connection, so a press is usually a single GET instead of GET + login + GET.
+# requests.Session is not thread-safe; a thread-local session avoids holding a
+# lock across network I/O, so one slow WML response never blocks other presses.
+_wml_local = threading.local()
+
+
+def _fetch_profile(username: str, password: str, wml_id: str):
+    session = getattr(_wml_local, "session", None)
+    if session is None:
+        session = _wml_local.session = requests.Session()
+    return fetch_profile_by_id(session, username, password, wml_id)
 
 
 @router.callback_query(F.data.startswith("wml_add:"))
@@ -28,9 +45,8 @@ async def cb_wml_add(query: CallbackQuery, config: Config, notion: NotionClient,
         await safe_query_answer(query, "⛔ Немає доступу", show_alert=True)
         return
 
-    parts = query.data.split(":")
-    wml_id = parts[1]
-    has_tango_date = len(parts) > 2 and parts[2] == "1"
+    wml_id, _, flag = query.data.partition(":")[2].partition(":")
+    has_tango_date = flag.partition(":")[0] == "1"
 
     lock_key = f"wml_add_lock:{wml_id}"
     if not await try_acquire_write_lock(redis, lock_key):
@@ -45,9 +61,8 @@ async def cb_wml_add(query: CallbackQuery, config: Config, notion: NotionClient,
             return
 
         try:
-            session = requests.Session()
             detail = await asyncio.to_thread(
-                fetch_profile_by_id, session, config.wml_username, config.wml_password, wml_id
+                _fetch_profile, config.wml_username, config.wml_password, wml_id
             )
         except Exception as e:
             LOGGER.exception("Failed to fetch WML profile %s for Notion add", wml_id)
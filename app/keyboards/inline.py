@@ -1,5 +1,43 @@
+import functools
+from datetime import date
+
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
-from aiogram.utils.keyboard import InlineKeyboardBuilder
+
+
+# Content multi-select groups, one keyboard row each:
+# основные типы / платформы / специальные.
+_ACCOUNTING_CONTENT_GROUPS = (
+    ("main", "new main", "basic"),
+    ("twitter", "reddit", "fansly"),
+    ("ad request", "no content", "event"),
+)
+_SHOOT_CONTENT_GROUPS = (
+    ("main", "new main", "basic"),
+    ("twitter", "reddit", "fansly"),
+    ("SFS", "posting", "event"),
+)
+
+
+def _content_multiselect_rows(
+    groups: tuple[tuple[str, ...], ...],
+    selected: list[str],
+    mark_on: str,
+    mark_off: str,
+    code: str,
+    s: str,
+) -> list[list[InlineKeyboardButton]]:
+    """Toggle rows shared by the accounting and shoot content pickers."""
+    chosen = set(selected)
+    return [
+        [
+            InlineKeyboardButton(
+                text=f"{mark_on if ct in chosen else mark_off}{ct}",
+                callback_data=f"nlp:{code}:{ct}{s}",
+            )
+            for ct in group
+        ]
+        for group in groups
+    ]
 
 
 def nlp_accounting_content_keyboard(
@@ -9,41 +47,10 @@ def nlp_accounting_content_keyboard(
 ) -> InlineKeyboardMarkup:
     """Multi-select content types for accounting Content property."""
     s = f":{k}" if k else ""
-    builder = InlineKeyboardBuilder()
-
-    # Группа 1: Основные типы
-    row1 = []
-    for ct in ["main", "new main", "basic"]:
-        mark = "✅ " if ct in selected else "⬜ "
-        row1.append(InlineKeyboardButton(
-            text=f"{mark}{ct}",
-            callback_data=f"nlp:acct:{ct}{s}",
-        ))
-    builder.row(*row1)
-
-    # Группа 2: Платформы
-    row2 = []
-    for ct in ["twitter", "reddit", "fansly"]:
-        mark = "✅ " if ct in selected else "⬜ "
-        row2.append(InlineKeyboardButton(
-            text=f"{mark}{ct}",
-            callback_data=f"nlp:acct:{ct}{s}",
-        ))
-    builder.row(*row2)
-
-    # Группа 3: Специальные
-    row3 = []
-    for ct in ["ad request", "no content", "event"]:
-        mark = "✅ " if ct in selected else "⬜ "
-        row3.append(InlineKeyboardButton(
-            text=f"{mark}{ct}",
-            callback_data=f"nlp:acct:{ct}{s}",
-        ))
-    builder.row(*row3)
-
-    builder.row(InlineKeyboardButton(text="✓ Создать", callback_data=f"nlp:accs:save{s}"))
-    builder.row(nlp_back_button(model_id))
-    return builder.as_markup()
+    rows = _content_multiselect_rows(_ACCOUNTING_CONTENT_GROUPS, selected, "✅ ", "⬜ ", "acct", s)
+    rows.append([InlineKeyboardButton(text="✓ Создать", callback_data=f"nlp:accs:save{s}")])
+    rows.append([nlp_back_button(model_id)])
+    return InlineKeyboardMarkup(inline_keyboard=rows)
 
 
 # ==================== NLP Router Keyboards ====================
@@ -91,23 +98,42 @@ ORDER_TYPE_DISPLAY = {
 
 
 _NLP_CANCEL_BTN = InlineKeyboardButton(text="⬅ Назад", callback_data="nlp:x:c")
-
-
+# Token-free buttons inside otherwise per-render keyboards: built once, so a
+# render only allocates the buttons that carry model_id/token.
+_NLP_NO_BTN = InlineKeyboardButton(text="Нет", callback_data="nlp:x:c")
+_NLP_DONE_BTN = InlineKeyboardButton(text="✓ Готово", callback_data="nlp:x:c")
+_NLP_NO_ORDERS_BTN = InlineKeyboardButton(text="📄 Нет заказов", callback_data="nlp:noop")
+_FILES_CONTENT_TYPE_BTNS = (
+    (
+        InlineKeyboardButton(text="Reddit", callback_data="nlp:fct:reddit"),
+        InlineKeyboardButton(text="Twitter", callback_data="nlp:fct:twitter"),
+    ),
+    (
+        InlineKeyboardButton(text="OF ▶", callback_data="nlp:fct:of"),
+        InlineKeyboardButton(text="Extras ▶", callback_data="nlp:fct:extras"),
+    ),
+)
+
+
+@functools.lru_cache(maxsize=256)
 def nlp_back_button(model_id: str) -> InlineKeyboardButton:
-    """Stateless back button (model_id in callback)."""
+    """Stateless back button (model_id in callback).
+
+    Depends only on model_id, so the button is built once per model
+    and shared by every keyboard that ends with it.
+    """
     return InlineKeyboardButton(text="⬅ Назад", callback_data=f"nlp:bk:{model_id}")
 
 
 def nlp_model_selection_keyboard(models: list[dict], k: str = "") -> InlineKeyboardMarkup:
     """Model disambiguation. Intent is stored in memory_state by caller."""
-    builder = InlineKeyboardBuilder()
-    for model in models[:5]:
-        cb = f"nlp:sm:{model['id']}"
-        if k:
-            cb += f":{k}"
-        builder.row(InlineKeyboardButton(text=model["name"], callback_data=cb))
-    builder.row(_NLP_CANCEL_BTN)
-    return builder.as_markup()
+    s = f":{k}" if k else ""
+    rows = [
+        [InlineKeyboardButton(text=model["name"], callback_data=f"nlp:sm:{model['id']}{s}")]
+        for model in models[:5]
+    ]
+    rows.append([_NLP_CANCEL_BTN])
+    return InlineKeyboardMarkup(inline_keyboard=rows)
 
 
 def nlp_confirm_model_keyboard(model_id: str, model_name: str, k: str = "") -> InlineKeyboardMarkup:
@@ -117,12 +143,18 @@ def nlp_confirm_model_keyboard(model_id: str, model_name: str, k: str = "") -> I
         cb += f":{k}"
     return InlineKeyboardMarkup(inline_keyboard=[
         [InlineKeyboardButton(text=f"Да, {model_name}", callback_data=cb)],
-        [InlineKeyboardButton(text="Нет", callback_data="nlp:x:c")],
+        [_NLP_NO_BTN],
     ])
 
 
+@functools.lru_cache(maxsize=256)
 def nlp_back_keyboard(model_id: str) -> InlineKeyboardMarkup:
-    """Single back button to return to model card."""
+    """Single back button to return to model card.
+
+    Like the other token-free keyboards below, the markup depends only on its
+    arguments, so it is cached and one instance is shared. Callers must not
+    mutate returned markups; they are only ever serialized.
+    """
     return InlineKeyboardMarkup(inline_keyboard=[[nlp_back_button(model_id)]])
 
 def model_card_keyboard(k: str = "") -> InlineKeyboardMarkup:
@@ -141,7 +173,7 @@ def model_card_keyboard(k: str = "") -> InlineKeyboardMarkup:
         ],
         [
             InlineKeyboardButton(text="📝 Заметка", callback_data=f"nlp:act:note{s}"),
-            InlineKeyboardButton(text="✓ Готово", callback_data="nlp:x:c"),
+            _NLP_DONE_BTN,
         ],
     ])
 
@@ -162,22 +194,32 @@ def nlp_orders_menu_keyboard(
             rows.append([InlineKeyboardButton(text="✓ Закрыть", callback_data=f"nlp:om:close{s}")])
         rows.append([InlineKeyboardButton(text="📄 Просмотр заказов", callback_data=f"nlp:om:view{s}")])
     else:
-        rows.append([InlineKeyboardButton(text="📄 Нет заказов", callback_data="nlp:noop")])
+        rows.append([_NLP_NO_ORDERS_BTN])
     rows.append([nlp_back_button(model_id)])
     return InlineKeyboardMarkup(inline_keyboard=rows)
 
 
+@functools.lru_cache(maxsize=256)
+def _page_button(code: str, text: str, target: int) -> InlineKeyboardButton:
+    return InlineKeyboardButton(text=text, callback_data=f"nlp:{code}:{target}")
+
+
+def _pagination_row(code: str, page: int, total_pages: int) -> list[InlineKeyboardButton]:
+    """⬅️/➡️ row for a paginated list (callback nlp:{code}:{page}); needs total_pages > 1."""
+    row: list[InlineKeyboardButton] = []
+    if page > 1:
+        row.append(_page_button(code, "⬅️", page - 1))
+    if page < total_pages:
+        row.append(_page_button(code, "➡️", page + 1))
+    return row
+
+
+@functools.lru_cache(maxsize=256)
 def nlp_orders_view_keyboard(page: int, total_pages: int, model_id: str) -> InlineKeyboardMarkup:
     """Orders view pagination + back."""
     rows: list[list[InlineKeyboardButton]] = []
     if total_pages > 1:
-        pagination: list[InlineKeyboardButton] = []
-        if page > 1:
-            pagination.append(InlineKeyboardButton(text="⬅️", callback_data=f"nlp:op:{page - 1}"))
-        if page < total_pages:
-            pagination.append(InlineKeyboardButton(text="➡️", callback_data=f"nlp:op:{page + 1}"))
-        if pagination:
-            rows.append(pagination)
+        rows.append(_pagination_row("op", page, total_pages))
     rows.append([nlp_back_button(model_id)])
     return InlineKeyboardMarkup(inline_keyboard=rows)
 
@@ -252,21 +294,24 @@ def nlp_order_qty_keyboard(model_id: str, k: str = "") -> InlineKeyboardMarkup:
     ])
 
 
-def nlp_order_date_keyboard(model_id: str, k: str = "") -> InlineKeyboardMarkup:
-    """Date selection for order creation. All context in memory."""
+def _past_date_keyboard(code: str, model_id: str, k: str) -> InlineKeyboardMarkup:
+    """Сегодня / Вчера / другая дата picker shared by order and close flows."""
     s = f":{k}" if k else ""
     return InlineKeyboardMarkup(inline_keyboard=[
         [
-            InlineKeyboardButton(text="Сегодня", callback_data=f"nlp:od:today{s}"),
-            InlineKeyboardButton(text="Вчера", callback_data=f"nlp:od:yesterday{s}"),
-        ],
-        [
-            InlineKeyboardButton(text="📅 Другая дата", callback_data=f"nlp:od:custom{s}"),
+            InlineKeyboardButton(text="Сегодня", callback_data=f"nlp:{code}:today{s}"),
+            InlineKeyboardButton(text="Вчера", callback_data=f"nlp:{code}:yesterday{s}"),
         ],
+        [InlineKeyboardButton(text="📅 Другая дата", callback_data=f"nlp:{code}:custom{s}")],
         [nlp_back_button(model_id)],
     ])
 
 
+def nlp_order_date_keyboard(model_id: str, k: str = "") -> InlineKeyboardMarkup:
+    """Date selection for order creation. All context in memory."""
+    return _past_date_keyboard("od", model_id, k)
+
+
 def nlp_order_confirm_keyboard(model_id: str, k: str = "") -> InlineKeyboardMarkup:
     """Confirmation after date selection. All context in memory."""
     s = f":{k}" if k else ""
@@ -327,56 +372,17 @@ def nlp_shoot_content_keyboard(
 ) -> InlineKeyboardMarkup:
     """Multi-select content types for shoot creation via NLP."""
     s = f":{k}" if k else ""
-    builder = InlineKeyboardBuilder()
-
-    # Группа 1: Основные типы
-    row1 = []
-    for ct in ["main", "new main", "basic"]:
-        mark = "✓ " if ct in selected else ""
-        row1.append(InlineKeyboardButton(
-            text=f"{mark}{ct}",
-            callback_data=f"nlp:sct:{ct}{s}",
-        ))
-    builder.row(*row1)
-
-    # Группа 2: Платформы
-    row2 = []
-    for ct in ["twitter", "reddit", "fansly"]:
-        mark = "✓ " if ct in selected else ""
-        row2.append(InlineKeyboardButton(
-            text=f"{mark}{ct}",
-            callback_data=f"nlp:sct:{ct}{s}",
-        ))
-    builder.row(*row2)
-
-    # Группа 3: Специальные
-    row3 = []
-    for ct in ["SFS", "posting", "event"]:
-        mark = "✓ " if ct in selected else ""
-        row3.append(InlineKeyboardButton(
-            text=f"{mark}{ct}",
-            callback_data=f"nlp:sct:{ct}{s}",
-        ))
-    builder.row(*row3)
-
-    builder.row(InlineKeyboardButton(text="✅ Готово", callback_data=f"nlp:scd:done{s}"))
-    builder.row(nlp_back_button(model_id))
-    return builder.as_markup()
+    rows = _content_multiselect_rows(_SHOOT_CONTENT_GROUPS, selected, "✓ ", "", "sct", s)
+    rows.append([InlineKeyboardButton(text="✅ Готово", callback_data=f"nlp:scd:done{s}")])
+    rows.append([nlp_back_button(model_id)])
+    return InlineKeyboardMarkup(inline_keyboard=rows)
 
 
 # ==================== NLP Close Order Keyboards ====================
 
 def nlp_close_order_date_keyboard(model_id: str, k: str = "") -> InlineKeyboardMarkup:
     """Date for closing order. order_id in memory."""
-    s = f":{k}" if k else ""
-    return InlineKeyboardMarkup(inline_keyboard=[
-        [
-            InlineKeyboardButton(text="Сегодня", callback_data=f"nlp:cd:today{s}"),
-            InlineKeyboardButton(text="Вчера", callback_data=f"nlp:cd:yesterday{s}"),
-        ],
-        [InlineKeyboardButton(text="📅 Другая дата", callback_data=f"nlp:cd:custom{s}")],
-        [nlp_back_button(model_id)],
-    ])
+    return _past_date_keyboard("cd", model_id, k)
 
 
 def nlp_close_order_select_keyboard(
@@ -387,33 +393,26 @@ def nlp_close_order_select_keyboard(
     k: str = "",
 ) -> InlineKeyboardMarkup:
     """Select an order to close (paginated)."""
-    builder = InlineKeyboardBuilder()
+    s = f":{k}" if k else ""
+    today = date.today()
+    rows: list[list[InlineKeyboardButton]] = []
     for order in orders:
-        from datetime import date as _date
         days = 0
         date_label = "?"
         if order.in_date:
             try:
-                d = _date.fromisoformat(order.in_date[:10])
-                date_label = d.strftime("%d.%m")
-                days = (_date.today() - d).days
+                d = date.fromisoformat(order.in_date[:10])
+                date_label = f"{d.day:02d}.{d.month:02d}"
+                days = (today - d).days
             except (ValueError, TypeError):
                 pass
         label = f"{order.order_type or '?'} · {date_label} ({days}d)"
-        cb = f"nlp:co:{order.page_id}"
-        if k:
-            cb += f":{k}"
-        builder.row(InlineKeyboardButton(text=label, callback_data=cb))
+        cb = f"nlp:co:{order.page_id}{s}"
+        rows.append([InlineKeyboardButton(text=label, callback_data=cb)])
     if total_pages > 1:
-        pagination: list[InlineKeyboardButton] = []
-        if page > 1:
-            pagination.append(InlineKeyboardButton(text="⬅️", callback_data=f"nlp:cp:{page - 1}"))
-        if page < total_pages:
-            pagination.append(InlineKeyboardButton(text="➡️", callback_data=f"nlp:cp:{page + 1}"))
-        if pagination:
-            builder.row(*pagination)
-    builder.row(nlp_back_button(model_id))
-    return builder.as_markup()
+        rows.append(_pagination_row("cp", page, total_pages))
+    rows.append([nlp_back_button(model_id)])
+    return InlineKeyboardMarkup(inline_keyboard=rows)
 
 
 # ==================== NLP Files Keyboard ====================
@@ -432,51 +431,53 @@ def nlp_files_qty_keyboard(model_id: str, k: str = "") -> InlineKeyboardMarkup:
     ])
 
 
+@functools.lru_cache(maxsize=256)
 def nlp_files_content_type_keyboard(model_id: str) -> InlineKeyboardMarkup:
     """Level 1 content-type menu for adding files in NLP flow."""
     return InlineKeyboardMarkup(inline_keyboard=[
-        [
-            InlineKeyboardButton(text="Reddit", callback_data="nlp:fct:reddit"),
-            InlineKeyboardButton(text="Twitter", callback_data="nlp:fct:twitter"),
-        ],
-        [
-            InlineKeyboardButton(text="OF ▶", callback_data="nlp:fct:of"),
-            InlineKeyboardButton(text="Extras ▶", callback_data="nlp:fct:extras"),
-        ],
+        *(list(row) for row in _FILES_CONTENT_TYPE_BTNS),
         [nlp_back_button(model_id)],
     ])
 
 
+# Static submenus: no model_id/token, so built once at import and shared
+# (callers never mutate markups; aiogram only serializes them on send).
+_FILES_OF_TYPE_KB = InlineKeyboardMarkup(inline_keyboard=[
+    [
+        InlineKeyboardButton(text="Main Pack", callback_data="nlp:fct:main_pack"),
+        InlineKeyboardButton(text="New Main", callback_data="nlp:fct:new_main"),
+    ],
+    [
+        InlineKeyboardButton(text="Basic", callback_data="nlp:fct:basic"),
+        InlineKeyboardButton(text="Event", callback_data="nlp:fct:event"),
+    ],
+    [InlineKeyboardButton(text="Request", callback_data="nlp:fct:request")],
+    [InlineKeyboardButton(text="← Назад", callback_data="nlp:fct:back")],
+])
+
+_FILES_EXTRAS_TYPE_KB = InlineKeyboardMarkup(inline_keyboard=[
+    [InlineKeyboardButton(text="Fansly", callback_data="nlp:fct:fansly")],
+    [
+        InlineKeyboardButton(text="Instagram", callback_data="nlp:fct:instagram"),
+        InlineKeyboardButton(text="Snapchat", callback_data="nlp:fct:snapchat"),
+    ],
+    [InlineKeyboardButton(text="← Назад", callback_data="nlp:fct:back")],
+])
+
+
 def nlp_files_of_type_keyboard() -> InlineKeyboardMarkup:
     """Level 2 OF submenu for adding files."""
-    return InlineKeyboardMarkup(inline_keyboard=[
-        [
-            InlineKeyboardButton(text="Main Pack", callback_data="nlp:fct:main_pack"),
-            InlineKeyboardButton(text="New Main", callback_data="nlp:fct:new_main"),
-        ],
-        [
-            InlineKeyboardButton(text="Basic", callback_data="nlp:fct:basic"),
-            InlineKeyboardButton(text="Event", callback_data="nlp:fct:event"),
-        ],
-        [InlineKeyboardButton(text="Request", callback_data="nlp:fct:request")],
-        [InlineKeyboardButton(text="← Назад", callback_data="nlp:fct:back")],
-    ])
+    return _FILES_OF_TYPE_KB
 
 
 def nlp_files_extras_type_keyboard() -> InlineKeyboardMarkup:
     """Level 2 Extras submenu for adding files."""
-    return InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(text="Fansly", callback_data="nlp:fct:fansly")],
-        [
-            InlineKeyboardButton(text="Instagram", callback_data="nlp:fct:instagram"),
-            InlineKeyboardButton(text="Snapchat", callback_data="nlp:fct:snapchat"),
-        ],
-        [InlineKeyboardButton(text="← Назад", callback_data="nlp:fct:back")],
-    ])
+    return _FILES_EXTRAS_TYPE_KB
 
 
 # ==================== NLP Flow Control ====================
 
+@functools.lru_cache(maxsize=256)
 def nlp_action_complete_keyboard(model_id: str) -> InlineKeyboardMarkup:
     """Post-action keyboard shown after every successful NLP action.
 
@@ -498,17 +499,12 @@ def nlp_action_complete_keyboard(model_id: str) -> InlineKeyboardMarkup:
 
 def nlp_not_found_keyboard(recent: list[tuple[str, str]], k: str = "") -> InlineKeyboardMarkup:
     """Model not found — recent models. Intent in memory."""
-    builder = InlineKeyboardBuilder()
-    row: list[InlineKeyboardButton] = []
-    for model_id, title in recent[:5]:
-        cb = f"nlp:sm:{model_id}"
-        if k:
-            cb += f":{k}"
-        row.append(InlineKeyboardButton(text=title, callback_data=cb))
-        if len(row) == 3:
-            builder.row(*row)
-            row = []
-    if row:
-        builder.row(*row)
-    builder.row(_NLP_CANCEL_BTN)
-    return builder.as_markup()
+    s = f":{k}" if k else ""
+    buttons = [
+        InlineKeyboardButton(text=title, callback_data=f"nlp:sm:{model_id}{s}")
+        for model_id, title in recent[:5]
+    ]
+    # Up to three per row
+    rows = [buttons[i:i + 3] for i in range(0, len(buttons), 3)]
+    rows.append([_NLP_CANCEL_BTN])
+    return InlineKeyboardMarkup(inline_keyboard=rows)
@@ -13,6 +13,7 @@ Routing pipeline:
 import asyncio
 import html
 import logging
+import re
 import time
 from datetime import date, datetime, timedelta
 
@@ -20,15 +21,29 @@ from aiogram.exceptions import TelegramBadRequest
 from aiogram.types import Message
 
 from app.config import Config
+from app.keyboards.inline import (
+    model_card_keyboard,
+    nlp_action_complete_keyboard,
+    nlp_confirm_model_keyboard,
+    nlp_files_content_type_keyboard,
+    nlp_model_selection_keyboard,
+    nlp_not_found_keyboard,
+    nlp_order_confirm_keyboard,
+    nlp_order_date_keyboard,
+    nlp_shoot_location_keyboard,
+)
+from app.roles import is_editor
 from app.services import NotionClient
 from app.services import orders as orders_cache
 from app.services import planner as planner_cache
 from app.services import accounting as accounting_cache
+from app.services.model_card import build_model_card, clear_card_cache
 from app.state import MemoryState, RecentModels, generate_token
 
 from app.router.prefilter import prefilter_message
 from app.router.entities_v2 import (
     extract_entities_v2,
+    get_order_type_display_name,
     validate_model_name,
 )
 from app.router.command_filters import CommandIntent
@@ -52,6 +67,24 @@ async def _safe_edit_reply_markup(bot, chat_id: int, message_id: int) -> None:
         pass
 
 
+# Strong refs for fire-and-forget tasks; the loop only keeps weak ones.
+_background_tasks: set[asyncio.Task] = set()
+
+
+async def _safe_delete(message: Message) -> None:
+    try:
+        await message.delete()
+    except Exception:
+        pass
+
+
+def _delete_in_background(message: Message) -> None:
+    """Delete the user's input message without blocking the reply on it."""
+    task = asyncio.create_task(_safe_delete(message))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
 async def _safe_delete_or_mark_done(bot, chat_id: int, message_id: int) -> None:
     try:
         await bot.delete_message(chat_id=chat_id, message_id=message_id)
@@ -95,7 +128,7 @@ async def _clear_previous_screen_keyboard(message: Message, memory_state: Memory
     prev_id = state.get("screen_message_id")
     if not prev_id:
         return
-    await _safe_edit_reply_markup(message.bot, message.chat.id, prev_id)
+    await _safe_edit_reply_markup(message.bot, chat_id, prev_id)
 
 
 def _remember_screen_message(
@@ -122,7 +155,7 @@ async def _cleanup_prompt_message(message: Message, memory_state: MemoryState) -
         LOGGER.warning("[CLEANUP] No prompt_id in state!")
         return
     LOGGER.info(f"[CLEANUP] Attempting to delete message {prompt_id}")
-    await _safe_delete_or_mark_done(message.bot, message.chat.id, prompt_id)
+    await _safe_delete_or_mark_done(message.bot, chat_id, prompt_id)
     memory_state.update(chat_id, user_id, prompt_message_id=None)
     LOGGER.info("[CLEANUP] Cleanup complete")
 
@@ -256,8 +289,6 @@ async def _route_message_impl(
 
         elif resolution["status"] == "confirm":
             # Fuzzy-only match — ask user to confirm before executing
-            from app.keyboards.inline import nlp_confirm_model_keyboard
-
             m = resolution["model"]
             k = generate_token()
             # Store intent in memory (keyboard only carries model_id)
@@ -274,8 +305,6 @@ async def _route_message_impl(
 
         elif resolution["status"] == "multiple":
             # Show disambiguation keyboard
-            from app.keyboards.inline import nlp_model_selection_keyboard
-
             k = generate_token()
             # Store intent in memory (keyboard only carries model_id)
             memory_state.set(chat_id, user_id, {
@@ -293,7 +322,6 @@ async def _route_message_impl(
             if model_required:
                 recent = recent_models.get(user_id)
                 if recent:
-                    from app.keyboards.inline import nlp_not_found_keyboard
                     k = generate_token()
                     # Store intent in memory for when user picks a recent model
                     memory_state.set(chat_id, user_id, {
@@ -360,11 +388,10 @@ async def _execute_handler(
     if intent == CommandIntent.SEARCH_MODEL:
         if model:
             # CRM UX: show universal model card with live data
-            from app.keyboards.inline import model_card_keyboard
-            from app.services.model_card import build_model_card
+            chat_id, user_id = message.chat.id, message.from_user.id
             k = generate_token()
             await _clear_previous_screen_keyboard(message, memory_state)
-            memory_state.set(message.chat.id, message.from_user.id, {
+            memory_state.set(chat_id, user_id, {
                 "flow": "nlp_actions",
                 "model_id": model["id"],
                 "model_name": model["name"],
@@ -380,8 +407,8 @@ async def _execute_handler(
             )
             _remember_screen_message(
                 memory_state,
-                message.chat.id,
-                message.from_user.id,
+                chat_id,
+                user_id,
                 sent.message_id if sent else None,
             )
         else:
@@ -442,16 +469,15 @@ async def _handle_shoot_comment_input(message, text, user_state, config, notion,
         await _cleanup_prompt_message(message, memory_state)
         memory_state.clear(chat_id, user_id)
         LOGGER.info("SHOOT_COMMENT_INPUT OK user=%s shoot_id=%s", user_id, shoot_id)
-        from app.keyboards.inline import nlp_action_complete_keyboard as _nlp_action_complete_keyboard
         sent = await message.answer(
             f"✅ Комментарий добавлен для <b>{html.escape(model_name)}</b>",
             parse_mode="HTML",
-            reply_markup=_nlp_action_complete_keyboard(user_state.get("model_id", "")),
+            reply_markup=nlp_action_complete_keyboard(user_state.get("model_id", "")),
         )
         _remember_screen_message(
             memory_state,
             chat_id,
-            message.from_user.id,
+            user_id,
             sent.message_id if sent else None,
         )
     except Exception as e:
@@ -462,10 +488,6 @@ async def _handle_shoot_comment_input(message, text, user_state, config, notion,
 
 async def _handle_custom_date_input(message, text, user_state, config, notion, memory_state):
     """Handle free-text date input (DD.MM) in nlp_shoot / nlp_close flows."""
-    import re
-    from app.roles import is_editor
-    from app.state import generate_token
-
     user_id = message.from_user.id
     chat_id = message.chat.id
     current_flow = user_state.get("flow", "")
@@ -508,10 +530,9 @@ async def _handle_custom_date_input(message, text, user_state, config, notion, m
             await _clear_previous_screen_keyboard(message, memory_state)
             await _cleanup_prompt_message(message, memory_state)
             memory_state.clear(chat_id, user_id)
-            from app.keyboards.inline import nlp_action_complete_keyboard as _nlp_action_complete_keyboard
             await message.answer(
                 f"✅ Съемка перенесена с {old_label} на {parsed_date.strftime('%d.%m')}",
-                reply_markup=_nlp_action_complete_keyboard(model_id),
+                reply_markup=nlp_action_complete_keyboard(model_id),
                 parse_mode="HTML",
             )
         else:
@@ -532,7 +553,6 @@ async def _handle_custom_date_input(message, text, user_state, config, notion, m
                 "content_types": content_types,
                 "k": k,
             })
-            from app.keyboards.inline import nlp_shoot_location_keyboard
             await _clear_previous_screen_keyboard(message, memory_state)
             await _cleanup_prompt_message(message, memory_state)
             await message.answer(
@@ -558,10 +578,9 @@ async def _handle_custom_date_input(message, text, user_state, config, notion, m
             await _clear_previous_screen_keyboard(message, memory_state)
             await _cleanup_prompt_message(message, memory_state)
             memory_state.clear(chat_id, user_id)
-            from app.keyboards.inline import nlp_action_complete_keyboard as _nlp_action_complete_keyboard
             await message.answer(
                 f"✅ Заказ закрыт · {parsed_date.strftime('%d.%m')}",
-                reply_markup=_nlp_action_complete_keyboard(model_id_for_kb),
+                reply_markup=nlp_action_complete_keyboard(model_id_for_kb),
                 parse_mode="HTML",
             )
         except Exception as e:
@@ -573,8 +592,6 @@ async def _handle_custom_date_input(message, text, user_state, config, notion, m
             await message.answer("❌ Нет доступа.")
             memory_state.clear(chat_id, user_id)
             return
-        from app.keyboards.inline import nlp_order_confirm_keyboard
-        from app.router.entities_v2 import get_order_type_display_name
 
         model_name = user_state.get("model_name", "")
         order_type = user_state.get("order_type", "")
@@ -600,7 +617,7 @@ async def _handle_custom_date_input(message, text, user_state, config, notion, m
         _remember_screen_message(
             memory_state,
             chat_id,
-            message.from_user.id,
+            user_id,
             sent.message_id if sent else None,
         )
     else:
@@ -613,8 +630,6 @@ MAX_FILES_INPUT = 1500  # configurable upper limit for manual file count
 
 async def _handle_custom_files_input(message, text, user_state, config, notion, memory_state):
     """Handle free-text number input for nlp_files flow (awaiting_count)."""
-    from app.roles import is_editor
-
     user_id = message.from_user.id
     chat_id = message.chat.id
 
@@ -640,7 +655,6 @@ async def _handle_custom_files_input(message, text, user_state, config, notion,
 
     await _clear_previous_screen_keyboard(message, memory_state)
     await _cleanup_prompt_message(message, memory_state)
-    from app.keyboards.inline import nlp_files_content_type_keyboard
     sent = await message.answer(
         f"📁 <b>{html.escape(model_name)}</b> · {count} файлов\n\nВыберите тип контента:",
         reply_markup=nlp_files_content_type_keyboard(model_id),
@@ -649,7 +663,7 @@ async def _handle_custom_files_input(message, text, user_state, config, notion,
     _remember_screen_message(
         memory_state,
         chat_id,
-        message.from_user.id,
+        user_id,
         sent.message_id if sent else None,
     )
 
@@ -691,8 +705,6 @@ async def _handle_note_input(message, text, user_state, config, notion, memory_s
         except Exception:
             LOGGER.warning("Failed to send owner note notification user=%s", user_id)
 
-    from app.keyboards.inline import model_card_keyboard
-    from app.services.model_card import build_model_card, clear_card_cache
     clear_card_cache()
 
     k = generate_token()
@@ -731,8 +743,6 @@ async def _handle_note_input(message, text, user_state, config, notion, memory_s
 
 async def _handle_accounting_comment_input(message, text, user_state, config, notion, memory_state):
     """Handle accounting comment input for nlp_accounting_comment flow."""
-    from app.roles import is_editor
-
     user_id = message.from_user.id
     chat_id = message.chat.id
     if not is_editor(user_id, config):
@@ -759,16 +769,15 @@ async def _handle_accounting_comment_input(message, text, user_state, config, no
         await _clear_previous_screen_keyboard(message, memory_state)
         await _cleanup_prompt_message(message, memory_state)
         memory_state.clear(chat_id, user_id)
-        from app.keyboards.inline import nlp_action_complete_keyboard as _nlp_action_complete_keyboard
         sent = await message.answer(
             f"✅ Комментарий обновлён для <b>{html.escape(model_name)}</b>",
             parse_mode="HTML",
-            reply_markup=_nlp_action_complete_keyboard(user_state.get("model_id", "")),
+            reply_markup=nlp_action_complete_keyboard(user_state.get("model_id", "")),
         )
         _remember_screen_message(
             memory_state,
             chat_id,
-            message.from_user.id,
+            user_id,
             sent.message_id if sent else None,
         )
     except Exception:
@@ -779,7 +788,6 @@ async def _handle_accounting_comment_input(message, text, user_state, config, no
 
 def _parse_files_count(text: str) -> int | None:
     """Parse a positive file count (1..MAX_FILES_INPUT) from text like "30", "+30", "30 файлов", "файлы 30"."""
-    import re
     t = text.strip().lower()
 
     # Pattern 1: optional '+', digits, optional suffix (ф/файл*)
@@ -813,7 +821,6 @@ async def _show_help_message(message: Message) -> None:
 
 async def _handle_custom_order_count_input(message, text, user_state, config, notion, memory_state):
     """Handle custom order count input."""
-    from app.roles import is_editor
     user_id = message.from_user.id
     chat_id = message.chat.id
 
@@ -831,9 +838,6 @@ async def _handle_custom_order_count_input(message, text, user_state, config, no
         await message.answer("❌ Введите число от 1 до 99")
         return
 
-    from app.keyboards.inline import nlp_order_date_keyboard
-    from app.router.entities_v2 import get_order_type_display_name
-
     model_name = user_state.get("model_name", "")
     order_type = user_state.get("order_type", "")
     model_id = user_state.get("model_id", "")
@@ -857,7 +861,6 @@ async def _handle_received_input(message, text, user_state, config, notion, memo
 
     Adds the entered number to current_received.  Auto-closes when total >= count.
     """
-    from app.roles import is_editor
     chat_id, user_id = message.chat.id, message.from_user.id
 
     if not is_editor(user_id, config):
@@ -881,16 +884,11 @@ async def _handle_received_input(message, text, user_state, config, notion, memo
 
     new_received = current_received + added
 
-    from app.keyboards.inline import nlp_action_complete_keyboard
-
     if new_received >= count:
         today_date = datetime.now(tz=config.timezone).date()
         await notion.close_order_with_received(order_id, today_date, new_received)
         orders_cache.clear_cache(model_id)
-        try:
-            await message.delete()
-        except Exception:
-            pass
+        _delete_in_background(message)
         memory_state.clear(chat_id, user_id)
         success_text = (
             f"✅ Заказ закрыт — <b>{html.escape(model_name)}</b>\n"
@@ -913,10 +911,7 @@ async def _handle_received_input(message, text, user_state, config, notion, memo
     else:
         await notion.update_order_received(order_id, new_received)
         orders_cache.clear_cache(model_id)
-        try:
-            await message.delete()
-        except Exception:
-            pass
+        _delete_in_background(message)
         memory_state.clear(chat_id, user_id)
         partial_text = (
             f"🔄 Обновлено — <b>{html.escape(model_name)}</b>\n"
@@ -1,8 +1,10 @@
 import asyncio
 import hmac
 import logging
+import logging.handlers
 import os
 import pathlib
+import queue
 from collections import deque
 
 from aiohttp import web
@@ -15,12 +17,35 @@ from app.handlers.notifications import update_board
 from app.handlers.reddit import update_reddit_board
 from app.services.wml_sync import run_wml_sync
 
+_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    format=_LOG_FORMAT,
 )
 LOGGER = logging.getLogger(__name__)
 
+
+def _start_queue_logging() -> logging.handlers.QueueListener:
+    """Move stderr writes off the event loop.
+
+    The QueueHandler still formats each record in the emitting thread (the
+    event loop); a QueueListener thread only does the stream writes, so a
+    slow stderr never stalls update processing.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root = logging.getLogger()
+    target_handlers = list(root.handlers)
+    for handler in target_handlers:
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue, *target_handlers, respect_handler_level=True,
+    )
+    listener.start()
+    return listener
+
+
 GIT_SHA = os.environ.get("GIT_SHA", "unknown")
 
 
@@ -188,9 +213,13 @@ async def create_app() -> web.Application:
 
 def main() -> None:
     """Run the server."""
+    listener = _start_queue_logging()
     port = int(os.environ.get("PORT", "8080"))
     LOGGER.info("Starting server on port %s  GIT_SHA=%s", port, GIT_SHA)
-    web.run_app(create_app(), host="0.0.0.0", port=port)
+    try:
+        web.run_app(create_app(), host="0.0.0.0", port=port)
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
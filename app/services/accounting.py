@@ -3,6 +3,7 @@
 Title format: "{MODEL_NAME} {месяц_ru_lower}" e.g. "КЛЕЩ февраль"
 Fields used: Title, model (relation), Files (number), Comment (rich_text), Content (multi_select).
 """
+import asyncio
 import logging
 import time
 from datetime import datetime
@@ -17,6 +18,8 @@ LOGGER = logging.getLogger(__name__)
 
 CACHE_TTL = 60.0
 _cache: dict[str, tuple[Any, float]] = {}
+# key → in-flight Notion query; concurrent misses for one key await the same task
+_inflight: dict[str, asyncio.Future] = {}
 
 
 def _get_cached(key: str) -> Any | None:
@@ -32,10 +35,20 @@ def _set_cached(key: str, data: Any) -> None:
     _cache[key] = (data, time.monotonic())
 
 
+def _on_fetched(key: str, task: asyncio.Future) -> None:
+    """Cache a finished fetch unless clear_cache() invalidated it meanwhile."""
+    if _inflight.get(key) is not task:
+        return
+    del _inflight[key]
+    if not task.cancelled() and task.exception() is None:
+        _set_cached(key, task.result())
+
+
 def clear_cache(model_id: str, yyyy_mm: str) -> None:
     """Clear accounting cache for specific model and month."""
     key = f"{model_id}:{yyyy_mm}"
     _cache.pop(key, None)
+    _inflight.pop(key, None)
 
 
 async def get_cached_monthly_record(
@@ -50,9 +63,14 @@ async def get_cached_monthly_record(
     if cached is not None:
         return cached
 
-    record = await notion.get_monthly_record(config.db_accounting, model_id, yyyy_mm)
-    _set_cached(key, record)
-    return record
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(
+            notion.get_monthly_record(config.db_accounting, model_id, yyyy_mm)
+        )
+        _inflight[key] = task
+        task.add_done_callback(lambda t: _on_fetched(key, t))
+    return await asyncio.shield(task)
 
 
 def _yyyy_mm(config: Config) -> str:
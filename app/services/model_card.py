@@ -1,13 +1,14 @@
 """Model Card service — builds CRM model card text and data."""
 
 import asyncio
+import copy
 import html
 import logging
 import time
 from datetime import date, datetime
 
 from app.config import Config
-from app.services.notion import NotionClient
+from app.services.notion import NotionClient, NotionModel
 
 LOGGER = logging.getLogger(__name__)
 
@@ -36,12 +37,24 @@ def _cache_get(key: str) -> str | None:
 def _cache_set(key: str, text: str, is_error: bool = False) -> None:
     """Store text in cache."""
     _card_cache[key] = (text, time.monotonic(), is_error)
+    # A new card generation: drop any model looked up for the previous one
+    _card_model_cache.pop(key, None)
+
+
+def is_card_cached(model_id: str) -> bool:
+    """True if build_model_card_by_id() would skip the card's Notion queries.
+
+    The model lookup may still run when the card was built by build_model_card().
+    """
+    key = model_id.lower()
+    return _cache_get(key) is not None and key in _orders_count_cache
 
 
 def clear_card_cache() -> None:
     """Clear the entire card cache (useful for tests)."""
     _card_cache.clear()
     _orders_count_cache.clear()
+    _card_model_cache.clear()
 
 
 # ===== Card builder =====
@@ -87,9 +100,55 @@ async def build_model_card(
     return text, open_orders
 
 
+async def build_model_card_by_id(
+    model_id: str,
+    config: Config,
+    notion: NotionClient,
+) -> tuple[NotionModel | None, str, int]:
+    """
+    Look up the model and build its card in one round-trip.
+
+    The model lookup runs concurrently with the card's Notion queries, since
+    the name is only needed for rendering. Returns (model, card_text,
+    open_orders_count); model is None (and the card empty) if not found.
+    """
+    cache_key = model_id.lower()
+    cached = _cache_get(cache_key)
+    cached_orders = _orders_count_cache.get(cache_key)
+    if cached is not None and cached_orders is not None:
+        model = _card_model_cache.get(cache_key)
+        if model is None:
+            # Card was built by build_model_card(): only the lookup is missing
+            model = await notion.get_model(model_id)
+            if not model:
+                return None, "", -1
+            _card_model_cache[cache_key] = copy.copy(model)
+            return model, cached, cached_orders
+        # Copy so a caller editing the model can't alter the cached entry.
+        return copy.copy(model), cached, cached_orders
+
+    now = datetime.now(tz=config.timezone)
+    model, results = await asyncio.gather(
+        notion.get_model(model_id),
+        _fetch_card_data(model_id, config, notion, now),
+    )
+    if not model:
+        return None, "", -1
+
+    text, is_error, open_orders = _render_card(model_id, model.title, now, results)
+    _cache_set(cache_key, text, is_error)
+    _orders_count_cache[cache_key] = open_orders
+    _card_model_cache[cache_key] = copy.copy(model)
+    return model, text, open_orders
+
+
 # Parallel cache for orders count (same TTL as card cache)
 _orders_count_cache: dict[str, int] = {}
 
+# Parallel cache for the looked-up model (same TTL as card cache), so a cached
+# card is served without another notion.get_model round-trip
+_card_model_cache: dict[str, NotionModel] = {}
+
 
 async def _build_card_text_impl(
     model_id: str,
@@ -102,20 +161,23 @@ async def _build_card_text_impl(
     is_error=True when any Notion call failed (contains "—").
     """
     now = datetime.now(tz=config.timezone)
-    today = now.date()
+    results = await _fetch_card_data(model_id, config, notion, now)
+    return _render_card(model_id, model_name, now, results)
 
-    orders_line = "—"
-    shoot_line: str | None = None
-    files_line = "—"
-    has_error = False
-    open_orders_count = -1
 
+async def _fetch_card_data(
+    model_id: str,
+    config: Config,
+    notion: NotionClient,
+    now: datetime,
+) -> list:
+    """Fetch orders, shoots, accounting and notes concurrently (exceptions returned in place)."""
     yyyy_mm = now.strftime("%Y-%m")
 
     async def _no_notes():
         return []
 
-    results = await asyncio.gather(
+    return await asyncio.gather(
         notion.query_open_orders(config.db_orders, model_page_id=model_id),
         notion.query_upcoming_shoots(
             config.db_planner,
@@ -127,6 +189,22 @@ async def _build_card_text_impl(
         return_exceptions=True,
     )
 
+
+def _render_card(
+    model_id: str,
+    model_name: str,
+    now: datetime,
+    results: list,
+) -> tuple[str, bool, int]:
+    """Render card HTML from _fetch_card_data results."""
+    today = now.date()
+
+    orders_line = "—"
+    shoot_line: str | None = None
+    files_line = "—"
+    has_error = False
+    open_orders_count = -1
+
     orders_result, shoots_result, accounting_result, notes_result = results
 
     # Orders open count
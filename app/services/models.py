@@ -12,6 +12,7 @@ class ModelsService:
 
     def __init__(self, config: Config):
         self.config = config
+        # Shared per-token client: reuses the process-wide connection pool.
         self.notion = NotionClient(config.notion_token)
 
     async def search_models(self, query: str, limit: int = 10) -> list[dict[str, Any]]:
@@ -50,5 +51,9 @@ class ModelsService:
             return None
 
     async def close(self):
-        """Close connections"""
-        await self.notion.close()
+        """Release the service.
+
+        NotionClient is a per-token singleton shared by every handler, so the
+        connection pool is left open here and closed once at shutdown via
+        NotionClient.close_all().
+        """
@@ -5,10 +5,22 @@ from datetime import date, datetime, timedelta, timezone
 from typing import Any
 
 import aiohttp
+import orjson
 
 NOTION_VERSION = "2022-06-28"
 LOGGER = logging.getLogger(__name__)
 
+# Fixed query fragments, built once and shared by every payload (never mutated;
+# aiohttp only serializes them). Per-call code adds just the variable parts.
+_OPEN_ORDER_FILTERS: tuple[dict[str, Any], ...] = (
+    {"property": "out", "date": {"is_empty": True}},
+    {"property": "status", "select": {"equals": "Open"}},
+)
+_SORTS_IN_ASC: list[dict[str, str]] = [{"property": "in", "direction": "ascending"}]
+_SORTS_LAST_EDITED_DESC: list[dict[str, str]] = [
+    {"timestamp": "last_edited_time", "direction": "descending"},
+]
+
 
 @dataclass
 class NotionModel:
@@ -130,6 +142,7 @@ class NotionClient:
                 "Content-Type": "application/json",
             },
             timeout=aiohttp.ClientTimeout(total=30.0),
+            json_serialize_bytes=orjson.dumps,
         )
         self._session_loop = loop
         return self._session
@@ -161,7 +174,7 @@ class NotionClient:
             try:
                 async with session.request(method, url, json=json) as response:
                     if response.status < 400:
-                        return await response.json()
+                        return await response.json(loads=orjson.loads)
 
                     payload = (await response.text()).strip()
                     short_payload = payload[:200] if payload else "<empty>"
@@ -391,10 +404,7 @@ class NotionClient:
         limit: int = 50,
     ) -> list[NotionOrder]:
         """Query open orders, optionally filtered by model."""
-        filters = [
-            {"property": "out", "date": {"is_empty": True}},
-            {"property": "status", "select": {"equals": "Open"}},
-        ]
+        filters = list(_OPEN_ORDER_FILTERS)
         
         if model_page_id:
             filters.append({"property": "model", "relation": {"contains": model_page_id}})
@@ -402,7 +412,7 @@ class NotionClient:
         payload = {
             "page_size": limit,
             "filter": {"and": filters},
-            "sorts": [{"property": "in", "direction": "ascending"}],
+            "sorts": _SORTS_IN_ASC,
         }
         
         url = f"https://api.notion.com/v1/databases/{database_id}/query"
@@ -664,7 +674,7 @@ class NotionClient:
 
         url = f"https://api.notion.com/v1/databases/{database_id}/query"
         model_filter = {"property": "model", "relation": {"contains": model_page_id}}
-        sorts = [{"timestamp": "last_edited_time", "direction": "descending"}]
+        sorts = _SORTS_LAST_EDITED_DESC
 
         # Step 1 — primary: "{month_ru} {year}" (e.g. "февраль 2026")
         primary_label = f"{month_label} {year}"
@@ -720,7 +730,7 @@ class NotionClient:
     ) -> list[NotionAccounting]:
         """Query accounting records that contain reddit content."""
         url = f"https://api.notion.com/v1/databases/{database_id}/query"
-        sorts = [{"timestamp": "last_edited_time", "direction": "descending"}]
+        sorts = _SORTS_LAST_EDITED_DESC
         payload = {
             "page_size": limit,
             "filter": {
@@ -1128,7 +1138,7 @@ class NotionClient:
         primary_label = f"{month_label} {year}"
 
         url = f"https://api.notion.com/v1/databases/{database_id}/query"
-        sorts = [{"timestamp": "last_edited_time", "direction": "descending"}]
+        sorts = _SORTS_LAST_EDITED_DESC
 
         all_items: list[dict[str, Any]] = []
         for search_term in (primary_label, month_label, yyyy_mm):
@@ -1,4 +1,5 @@
 """In-memory TTL cache for open orders queries."""
+import asyncio
 import logging
 import time
 from typing import Any
@@ -9,6 +10,8 @@ LOGGER = logging.getLogger(__name__)
 
 CACHE_TTL = 60.0
 _cache: dict[str, tuple[Any, float]] = {}
+# key → in-flight Notion query; concurrent misses for one key await the same task
+_inflight: dict[str, asyncio.Future] = {}
 
 
 def _get_cached(key: str) -> Any | None:
@@ -24,9 +27,19 @@ def _set_cached(key: str, data: Any) -> None:
     _cache[key] = (data, time.monotonic())
 
 
+def _on_fetched(key: str, task: asyncio.Future) -> None:
+    """Cache a finished fetch unless clear_cache() invalidated it meanwhile."""
+    if _inflight.get(key) is not task:
+        return
+    del _inflight[key]
+    if not task.cancelled() and task.exception() is None:
+        _set_cached(key, task.result())
+
+
 def clear_cache(model_id: str) -> None:
     """Clear orders cache for specific model."""
     _cache.pop(model_id, None)
+    _inflight.pop(model_id, None)
 
 
 async def get_cached_orders(
@@ -40,9 +53,12 @@ async def get_cached_orders(
     if cached is not None:
         return cached
 
-    orders = await notion.query_open_orders(
-        config.db_orders,
-        model_page_id=model_id,
-    )
-    _set_cached(key, orders)
-    return orders
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(notion.query_open_orders(
+            config.db_orders,
+            model_page_id=model_id,
+        ))
+        _inflight[key] = task
+        task.add_done_callback(lambda t: _on_fetched(key, t))
+    return await asyncio.shield(task)
@@ -15,7 +15,7 @@ if TYPE_CHECKING:
 LOGGER = logging.getLogger(__name__)
 
 from app.utils.constants import ARCHIVE_ORDERS_DBS, DB_FORMS_DEFAULT
-from app.utils.formatting import MONTHS_RU_LOWER
+from app.utils.formatting import MONTHS_EN_LOWER, MONTHS_RU_LOWER
 from app.services.notion import NotionClient
 
 _DB_MODELS_DEFAULT = "1fc32bee-e7a0-809f-8bbe-000be8182d4d"
@@ -206,7 +206,7 @@ async def _fetch_monthly_accounting(
     if not items and month_offset < 0:
         archive_page_id = os.getenv("ARCHIVE_PAGE_ID", "").strip()
         if archive_page_id:
-            month_en_full = target.strftime("%B").lower()
+            month_en_full = MONTHS_EN_LOWER[target.month - 1]
             archive_db_id = await notion.find_archive_accounting_db(archive_page_id, month_en_full)
             if archive_db_id:
                 LOGGER.debug(
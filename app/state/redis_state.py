@@ -141,16 +141,29 @@ class RedisMemoryState:
             )
         )
 
+    async def _update_data(self, key: str, updates: dict[str, Any]) -> dict[str, Any]:
+        assert self.redis_client is not None
+        data = await self._get_data(key) or {}
+        data.update(updates)
+        await self.redis_client.set(
+            key,
+            json.dumps(data, default=_default_serializer),
+            ex=self.ttl_seconds,
+        )
+        return data
+
     def update(
         self,
         chat_id: int,
         user_id: int,
         **updates: Any,
     ) -> dict[str, Any]:
-        data = self.get(chat_id, user_id) or {}
-        data.update(updates)
-        self.set(chat_id, user_id, data)
-        return data
+        # One GET + one SET in a single hop to the Redis loop. The merged data
+        # already carries prompt_message_id, so set()'s extra lookup is skipped.
+        key = self._resolve_key(chat_id, user_id)
+        if key is None:
+            return dict(updates)
+        return self._run(self._update_data(self._state_key(*key), updates))
 
     def clear(self, chat_id: int | tuple[int, int], user_id: int | None = None) -> None:
         key = self._resolve_key(chat_id, user_id)
@@ -14,6 +14,15 @@ MONTHS_RU = [
 
 MONTHS_RU_LOWER = [m.lower() for m in MONTHS_RU]
 
+# Fixed English names (calendar header, archive page titles); strftime("%B")
+# follows the locale.
+MONTHS_EN = [
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+]
+
+MONTHS_EN_LOWER = [m.lower() for m in MONTHS_EN]
+
 
 def format_date_short(d: date | str | None) -> str:
     """Format date as '15 Jan'."""
@@ -1,5 +1,6 @@
 """Telegram-related utilities."""
 import asyncio
+import time
 
 from aiogram.types import CallbackQuery
 from aiogram.types import InaccessibleMessage, Message
@@ -11,6 +12,11 @@ _MAX_NETWORK_RETRIES = 2
 _NETWORK_RETRY_DELAY = 1.0
 _MAX_FLOOD_RETRIES = 3
 
+# Callback query ids already acknowledged. Telegram accepts one answer per
+# query, so a repeated bare ACK is a wasted round-trip that always fails.
+_ANSWERED_TTL = 60.0
+_answered_queries: dict[str, float] = {}
+
 
 def is_owner_callback(query: CallbackQuery, config: Config) -> bool:
     """True only if the pressing user is the configured bot owner.
@@ -23,6 +29,22 @@ def is_owner_callback(query: CallbackQuery, config: Config) -> bool:
     return bool(config.owner_telegram_id) and bool(query.from_user) and query.from_user.id == config.owner_telegram_id
 
 
+def _is_unchanged(message: Message, text: str, reply_markup, parse_mode: str) -> bool:
+    """True if editing *message* to (text, reply_markup) would be a no-op.
+
+    Telegram answers such edits with "message is not modified" after a full
+    round-trip; the callback already carries the current message, so compare
+    locally and skip the request.
+    """
+    if parse_mode != "HTML" or not isinstance(message, Message):
+        return False
+    if message.reply_markup != reply_markup:
+        return False
+    if not message.text:
+        return False
+    return message.html_text == text
+
+
 async def safe_edit_message(
     query: CallbackQuery,
     text: str,
@@ -31,6 +53,8 @@ async def safe_edit_message(
 ) -> Message | None:
     if not query.message or isinstance(query.message, InaccessibleMessage):
         return None
+    if _is_unchanged(query.message, text, reply_markup, parse_mode):
+        return query.message
 
     flood_retries = 0
     network_retries = 0
@@ -93,7 +117,19 @@ async def safe_query_answer(
     text: str = "",
     show_alert: bool = False,
 ) -> None:
+    now = time.monotonic()
+    if not text and not show_alert:
+        answered_at = _answered_queries.get(query.id)
+        if answered_at is not None and now - answered_at < _ANSWERED_TTL:
+            return
     try:
         await query.answer(text, show_alert=show_alert)
-    except (TelegramNetworkError, TelegramBadRequest, asyncio.TimeoutError):
+    except (TelegramNetworkError, asyncio.TimeoutError):
+        return  # not delivered; a later ACK may still succeed
+    except TelegramBadRequest:
         pass
+    _answered_queries[query.id] = now
+    if len(_answered_queries) > 1000:
+        cutoff = now - _ANSWERED_TTL
+        for key in [key for key, ts in _answered_queries.items() if ts < cutoff]:
+            del _answered_queries[key]
@@ -141,6 +141,64 @@ class TestAccountingMultipleRecords:
         assert result.files == 100
 
 
+class TestCachedQueriesSingleFlight:
+    """Concurrent cache misses for one key share a single Notion query."""
+
+    @pytest.mark.asyncio
+    async def test_orders_misses_coalesce(self):
+        import asyncio
+        from app.services import orders as orders_cache
+
+        orders_cache.clear_cache("m-sf")
+        gate = asyncio.Event()
+
+        async def slow_query(*args, **kwargs):
+            await gate.wait()
+            return ["order"]
+
+        notion = MagicMock()
+        notion.query_open_orders = AsyncMock(side_effect=slow_query)
+        config = _make_config()
+
+        waiters = [
+            asyncio.ensure_future(orders_cache.get_cached_orders(notion, config, "m-sf"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        gate.set()
+        results = await asyncio.gather(*waiters)
+
+        assert results == [["order"]] * 3
+        assert notion.query_open_orders.await_count == 1
+        assert orders_cache._get_cached("m-sf") == ["order"]
+        orders_cache.clear_cache("m-sf")
+
+    @pytest.mark.asyncio
+    async def test_accounting_clear_drops_in_flight_result(self):
+        import asyncio
+        from app.services import accounting as accounting_cache
+
+        accounting_cache.clear_cache("m-sf", "2026-02")
+        gate = asyncio.Event()
+
+        async def slow_record(*args, **kwargs):
+            await gate.wait()
+            return "stale-record"
+
+        notion = MagicMock()
+        notion.get_monthly_record = AsyncMock(side_effect=slow_record)
+        config = _make_config()
+
+        waiter = asyncio.ensure_future(
+            accounting_cache.get_cached_monthly_record(notion, config, "m-sf", "2026-02")
+        )
+        await asyncio.sleep(0)
+        accounting_cache.clear_cache("m-sf", "2026-02")  # e.g. files were just added
+        gate.set()
+        assert await waiter == "stale-record"
+        assert accounting_cache._get_cached("m-sf:2026-02") is None
+
+
 class TestAccountingSearchFallbacks:
     """query_monthly_records uses 3-step search: primary → fallback1 → fallback2."""
 
@@ -133,6 +133,85 @@ class TestModelCardCache:
         _, _, is_error = entry
         assert is_error is True
 
+    @pytest.mark.asyncio
+    async def test_by_id_fetches_model_and_card_together(self):
+        """build_model_card_by_id renders with the looked-up name and caches."""
+        from app.services.model_card import build_model_card_by_id
+
+        from app.services.notion import NotionModel
+
+        mock_notion = AsyncMock()
+        mock_notion.get_model.return_value = NotionModel(page_id="model-id", title="Lookup")
+        mock_notion.query_open_orders.return_value = []
+        mock_notion.query_upcoming_shoots.return_value = []
+        mock_notion.get_monthly_record.return_value = None
+
+        from zoneinfo import ZoneInfo
+        mock_config = MagicMock()
+        mock_config.timezone = ZoneInfo("Europe/Brussels")
+        mock_config.db_notes = None
+
+        model, text, open_orders = await build_model_card_by_id("model-id", mock_config, mock_notion)
+        assert model.title == "Lookup"
+        assert "LOOKUP" in text
+        assert open_orders == 0
+
+        mock_notion.reset_mock()
+        model2, text2, _ = await build_model_card_by_id("model-id", mock_config, mock_notion)
+        assert text2 == text
+        assert model2.title == "Lookup" and model2 is not model
+        assert mock_notion.get_model.call_count == 0
+        assert mock_notion.query_open_orders.call_count == 0
+
+    @pytest.mark.asyncio
+    async def test_by_id_reuses_card_built_by_name(self):
+        """A card cached by build_model_card only costs the model lookup."""
+        from app.services.model_card import build_model_card, build_model_card_by_id
+        from app.services.notion import NotionModel
+
+        mock_notion = AsyncMock()
+        mock_notion.get_model.return_value = NotionModel(page_id="model-id", title="Lookup")
+        mock_notion.query_open_orders.return_value = []
+        mock_notion.query_upcoming_shoots.return_value = []
+        mock_notion.get_monthly_record.return_value = None
+
+        from zoneinfo import ZoneInfo
+        mock_config = MagicMock()
+        mock_config.timezone = ZoneInfo("Europe/Brussels")
+        mock_config.db_notes = None
+
+        text, _ = await build_model_card("model-id", "Lookup", mock_config, mock_notion)
+        mock_notion.reset_mock()
+
+        model, text2, open_orders = await build_model_card_by_id("model-id", mock_config, mock_notion)
+        assert model.title == "Lookup"
+        assert text2 == text and open_orders == 0
+        assert mock_notion.get_model.call_count == 1
+        assert mock_notion.query_open_orders.call_count == 0
+
+        await build_model_card_by_id("model-id", mock_config, mock_notion)
+        assert mock_notion.get_model.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_by_id_missing_model_not_cached(self):
+        from app.services.model_card import build_model_card_by_id, _card_cache
+
+        mock_notion = AsyncMock()
+        mock_notion.get_model.return_value = None
+        mock_notion.query_open_orders.return_value = []
+        mock_notion.query_upcoming_shoots.return_value = []
+        mock_notion.get_monthly_record.return_value = None
+
+        from zoneinfo import ZoneInfo
+        mock_config = MagicMock()
+        mock_config.timezone = ZoneInfo("Europe/Brussels")
+        mock_config.db_notes = None
+
+        model, text, _ = await build_model_card_by_id("gone", mock_config, mock_notion)
+        assert model is None
+        assert text == ""
+        assert "gone" not in _card_cache
+
 
 # ============================================================================
 #  3. MODEL CARD HAS ONLY 3 MODULE BUTTONS (NO MENU/RESET)
@@ -33,12 +33,16 @@ from app.keyboards.inline import (
     nlp_confirm_model_keyboard,
     nlp_model_selection_keyboard,
     nlp_not_found_keyboard,
+    nlp_files_of_type_keyboard,
+    nlp_files_extras_type_keyboard,
+    model_card_keyboard,
 )
 from app.handlers.nlp_callbacks import (
     _remember_screen_message,
     _validate_token,
     _validate_flow_step,
     _FLOW_STEP_RULES,
+    _MODEL_ACTION_HANDLERS,
 )
 
 
@@ -265,6 +269,14 @@ class TestFlowStepValidation:
         for action in _FLOW_STEP_RULES:
             assert _validate_flow_step(None, action) is False
 
+    def test_card_buttons_have_action_handlers(self):
+        """Every nlp:act:* button on the model card is routed."""
+        kb = model_card_keyboard("abc")
+        for row in kb.inline_keyboard:
+            for btn in row:
+                if btn.callback_data.startswith("nlp:act:"):
+                    assert btn.callback_data.split(":")[2] in _MODEL_ACTION_HANDLERS
+
     def test_unregulated_actions_always_pass(self):
         """Actions without flow/step rules should always pass."""
         for action in ("sm", "df", "do", "ro", "ra", "af", "co", "ct", "cmo", "bk", "noop", "fm", "smn", "sctm"):
@@ -319,6 +331,43 @@ class TestKeyboardTokenEmbedding:
         for cb in back_callbacks:
             assert cb == "nlp:bk:model-1", f"Back button has extra data: {cb}"
 
+    def test_back_button_shared_across_reports(self):
+        """Report keyboards for the same model reuse one back button."""
+        kb1 = nlp_report_keyboard("model-1", "aaaaaa")
+        kb2 = nlp_report_keyboard("model-1", "bbbbbb")
+        assert kb1.inline_keyboard[-1][0] is kb2.inline_keyboard[-1][0]
+        assert kb1.inline_keyboard[0][0].callback_data == "nlp:ro:aaaaaa"
+        assert kb2.inline_keyboard[0][0].callback_data == "nlp:ro:bbbbbb"
+
+    def test_menu_keyboards_share_cached_back_button(self):
+        """Multi-row keyboards keep the cached back button (no builder copy)."""
+        from app.keyboards.inline import nlp_back_button, nlp_shoot_content_keyboard
+        kb = nlp_shoot_content_keyboard(["main"], "model-1", "aaaaaa")
+        assert kb.inline_keyboard[-1][0] is nlp_back_button("model-1")
+        assert kb.inline_keyboard[0][0].text == "✓ main"
+
+    def test_token_free_keyboards_cached(self):
+        """Keyboards without a token are built once per argument set."""
+        from app.keyboards.inline import nlp_action_complete_keyboard, nlp_back_keyboard
+        assert nlp_back_keyboard("model-1") is nlp_back_keyboard("model-1")
+        assert nlp_back_keyboard("model-1") is not nlp_back_keyboard("model-2")
+        done = nlp_action_complete_keyboard("model-1")
+        assert done is nlp_action_complete_keyboard("model-1")
+        assert done.inline_keyboard[0][1].callback_data == "nlp:done:model-1"
+
+    def test_close_order_labels_zero_padded(self):
+        """Close picker labels use DD.MM and tolerate bad dates."""
+        from types import SimpleNamespace
+        from app.keyboards.inline import nlp_close_order_select_keyboard
+        orders = [
+            SimpleNamespace(page_id="p1", in_date="2024-03-05T10:00", order_type="Custom"),
+            SimpleNamespace(page_id="p2", in_date="bad", order_type=None),
+        ]
+        kb = nlp_close_order_select_keyboard(orders, 1, 1, "model-1", "aaaaaa")
+        assert kb.inline_keyboard[0][0].text.startswith("Custom · 05.03 (")
+        assert kb.inline_keyboard[1][0].text == "? · ? (0d)"
+        assert kb.inline_keyboard[0][0].callback_data == "nlp:co:p1:aaaaaa"
+
     def test_keyboard_without_token_works(self):
         """Keyboards should work without token (backwards compat)."""
         kb = nlp_order_type_keyboard("model-1")
@@ -517,6 +566,13 @@ class TestKeyboardStructure:
         yes_btn = kb.inline_keyboard[0][0]
         assert yes_btn.callback_data.endswith(":ab12")
 
+    def test_static_file_submenus_are_shared(self):
+        """Fully static submenus are built once and reused."""
+        assert nlp_files_of_type_keyboard() is nlp_files_of_type_keyboard()
+        assert nlp_files_extras_type_keyboard() is nlp_files_extras_type_keyboard()
+        callbacks = [btn.callback_data for row in nlp_files_of_type_keyboard().inline_keyboard for btn in row]
+        assert callbacks[-1] == "nlp:fct:back"
+
     def test_model_selection_keyboard_has_token(self):
         """nlp_model_selection_keyboard should embed token."""
         models = [{"id": "p1", "name": "Модель 1"}, {"id": "p2", "name": "Модель 2"}]
@@ -597,7 +653,8 @@ class TestMessageEditErrorHandling:
         parts = ["nlp", "sm", "page-123", "abc123"]
 
         with patch("app.handlers.nlp_callbacks._clear_previous_screen_keyboard", new=AsyncMock()), \
-             patch("app.services.model_card.build_model_card", new=AsyncMock(return_value=("card text", []))):
+             patch("app.services.model_card.build_model_card_by_id",
+                   new=AsyncMock(return_value=(notion.get_model.return_value, "card text", 0))):
             # This should not raise an exception even though edit_text raises TelegramBadRequest
             await _handle_select_model(query, parts, config, notion, memory_state, recent_models)
 
@@ -605,6 +662,297 @@ class TestMessageEditErrorHandling:
         assert True
 
 
+class TestSelectModelPlaceholder:
+    """A cold model card shows a loading placeholder; a cached one does not."""
+
+    def _query(self):
+        from unittest.mock import AsyncMock
+        query = MagicMock()
+        query.from_user.id = 42
+        query.message.chat.id = 100
+        query.message.message_id = 200
+        query.message.edit_text = AsyncMock()
+        return query
+
+    async def _select(self, query, cached):
+        from unittest.mock import AsyncMock, patch
+        from app.handlers.nlp_callbacks import _handle_select_model
+
+        model = MagicMock(title="Test Model", page_id="page-123")
+        with patch("app.handlers.nlp_callbacks._clear_previous_screen_keyboard", new=AsyncMock()), \
+             patch("app.services.model_card.is_card_cached", return_value=cached), \
+             patch("app.services.model_card.build_model_card_by_id",
+                   new=AsyncMock(return_value=(model, "card text", 0))):
+            await _handle_select_model(
+                query, ["nlp", "sm", "page-123"], MagicMock(), AsyncMock(),
+                MemoryState(ttl_seconds=60), MagicMock(),
+            )
+        return [c[0][0] for c in query.message.edit_text.call_args_list]
+
+    @pytest.mark.asyncio
+    async def test_cold_card_shows_placeholder_first(self):
+        texts = await self._select(self._query(), cached=False)
+        assert texts == ["⏳ Загружаю…", "card text"]
+
+    @pytest.mark.asyncio
+    async def test_cached_card_edits_once(self):
+        texts = await self._select(self._query(), cached=True)
+        assert texts == ["card text"]
+
+    @pytest.mark.asyncio
+    async def test_card_warmed_by_dispatcher_skips_placeholder(self):
+        from unittest.mock import AsyncMock, patch
+        from zoneinfo import ZoneInfo
+        from app.handlers.nlp_callbacks import _handle_select_model
+        from app.services.model_card import build_model_card, clear_card_cache
+        from app.services.notion import NotionModel
+
+        notion = AsyncMock()
+        notion.get_model.return_value = NotionModel(page_id="page-123", title="Test Model")
+        notion.query_open_orders.return_value = []
+        notion.query_upcoming_shoots.return_value = []
+        notion.get_monthly_record.return_value = None
+        config = MagicMock()
+        config.timezone = ZoneInfo("Europe/Brussels")
+        config.db_notes = None
+
+        clear_card_cache()
+        try:
+            text, _ = await build_model_card("page-123", "Test Model", config, notion)
+            notion.reset_mock()
+            query = self._query()
+            with patch("app.handlers.nlp_callbacks._clear_previous_screen_keyboard", new=AsyncMock()):
+                await _handle_select_model(
+                    query, ["nlp", "sm", "page-123"], config, notion,
+                    MemoryState(ttl_seconds=60), MagicMock(),
+                )
+        finally:
+            clear_card_cache()
+        assert [c[0][0] for c in query.message.edit_text.call_args_list] == [text]
+        assert notion.query_open_orders.await_count == 0
+
+    @pytest.mark.asyncio
+    async def test_cold_card_failure_leaves_back_button(self):
+        from unittest.mock import AsyncMock, patch
+        from app.handlers.nlp_callbacks import _handle_select_model
+
+        query = self._query()
+        with patch("app.services.model_card.is_card_cached", return_value=False), \
+             patch("app.services.model_card.build_model_card_by_id",
+                   new=AsyncMock(side_effect=RuntimeError("notion down"))):
+            await _handle_select_model(
+                query, ["nlp", "sm", "page-123"], MagicMock(), AsyncMock(),
+                MemoryState(ttl_seconds=60), MagicMock(),
+            )
+        last = query.message.edit_text.call_args_list[-1]
+        assert last[0][0] == "❌ Ошибка Notion — попробуй позже"
+        markup = last[1]["reply_markup"]
+        assert markup.inline_keyboard[0][0].callback_data == "nlp:bk:page-123"
+
+
+class TestReportDetailUsesStateName:
+    """Report detail screens take model_name from state, not Notion."""
+
+    @pytest.mark.asyncio
+    async def test_report_orders_skips_model_lookup(self):
+        from unittest.mock import AsyncMock, patch
+        from app.handlers.nlp_callbacks import _handle_report_orders
+        from app.services.notion import NotionOrder
+
+        query = MagicMock()
+        query.from_user.id = 42
+        query.message.chat.id = 100
+        query.message.message_id = 200
+        query.message.edit_text = AsyncMock()
+
+        memory_state = MemoryState(ttl_seconds=60)
+        memory_state.set(100, 42, {
+            "flow": "nlp_report", "model_id": "page-1", "model_name": "Клещ", "k": "abc123",
+        })
+        notion = AsyncMock()
+        orders = [NotionOrder(page_id="o1", title="t", order_type="custom", in_date="2026-02-01", status="Open")]
+
+        with patch("app.handlers.nlp_callbacks._clear_previous_screen_keyboard", new=AsyncMock()), \
+             patch("app.services.orders.get_cached_orders", new=AsyncMock(return_value=orders)):
+            await _handle_report_orders(query, MagicMock(), notion, memory_state)
+
+        notion.get_model.assert_not_awaited()
+        assert "Клещ" in query.message.edit_text.call_args[0][0]
+
+
+class TestShowReportFetch:
+    """_show_report fetches accounting and orders concurrently."""
+
+    @pytest.mark.asyncio
+    async def test_orders_failure_does_not_block_report(self):
+        from unittest.mock import AsyncMock, patch
+        from zoneinfo import ZoneInfo
+        from app.handlers.nlp_callbacks import _show_report
+
+        query = MagicMock()
+        query.from_user.id = 42
+        query.message.chat.id = 100
+        query.message.message_id = 200
+        query.message.edit_text = AsyncMock()
+        config = MagicMock()
+        config.timezone = ZoneInfo("Europe/Brussels")
+
+        with patch("app.handlers.nlp_callbacks._clear_previous_screen_keyboard", new=AsyncMock()), \
+             patch("app.services.accounting.get_cached_monthly_record", new=AsyncMock(return_value=None)), \
+             patch("app.services.orders.get_cached_orders", new=AsyncMock(side_effect=RuntimeError("down"))):
+            await _show_report(query, "page-1", "Клещ", config, AsyncMock(), MemoryState(ttl_seconds=60), "abc123")
+
+        text = query.message.edit_text.call_args[0][0]
+        assert "Клещ" in text
+        assert "0 открытых" in text
+
+    @pytest.mark.asyncio
+    async def test_cancelled_accounting_fetch_treated_as_missing(self):
+        import asyncio
+        from unittest.mock import AsyncMock, patch
+        from zoneinfo import ZoneInfo
+        from app.handlers.nlp_callbacks import _show_report
+
+        query = MagicMock()
+        query.from_user.id = 42
+        query.message.chat.id = 100
+        query.message.message_id = 200
+        query.message.edit_text = AsyncMock()
+        config = MagicMock()
+        config.timezone = ZoneInfo("Europe/Brussels")
+
+        with patch("app.handlers.nlp_callbacks._clear_previous_screen_keyboard", new=AsyncMock()), \
+             patch("app.services.accounting.get_cached_monthly_record",
+                   new=AsyncMock(side_effect=asyncio.CancelledError())), \
+             patch("app.services.orders.get_cached_orders", new=AsyncMock(return_value=[])):
+            await _show_report(query, "page-1", "Клещ", config, AsyncMock(), MemoryState(ttl_seconds=60), "abc123")
+
+        assert "Клещ" in query.message.edit_text.call_args[0][0]
+
+
+class TestInflightCallbackCoalescing:
+    """A double-tap landing while the first press is still handled is dropped."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicate_press_runs_once(self):
+        import asyncio
+        from unittest.mock import AsyncMock, patch
+        from app.handlers.nlp_callbacks import handle_nlp_callback
+
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_impl(*args, **kwargs):
+            started.set()
+            await release.wait()
+
+        def make_query(qid):
+            query = MagicMock()
+            query.id = qid
+            query.data = "nlp:sm:page-1"
+            query.from_user.id = 42
+            query.message.chat.id = 100
+            query.answer = AsyncMock()
+            return query
+
+        impl = AsyncMock(side_effect=slow_impl)
+        with patch("app.handlers.nlp_callbacks._handle_nlp_callback_impl", new=impl):
+            first = asyncio.create_task(handle_nlp_callback(
+                make_query("cbq-inflight-1"), MagicMock(), AsyncMock(), MemoryState(), MagicMock(),
+            ))
+            await started.wait()
+            await handle_nlp_callback(
+                make_query("cbq-inflight-2"), MagicMock(), AsyncMock(), MemoryState(), MagicMock(),
+            )
+            release.set()
+            await first
+            assert impl.await_count == 1
+
+            # Once the first press finished, the same button works again
+            await handle_nlp_callback(
+                make_query("cbq-inflight-3"), MagicMock(), AsyncMock(), MemoryState(), MagicMock(),
+            )
+            assert impl.await_count == 2
+
+
+class TestSafeQueryAnswerOnce:
+    """Bare re-ACKs of an already answered callback skip the Bot API."""
+
+    @pytest.mark.asyncio
+    async def test_second_bare_ack_skipped(self):
+        from unittest.mock import AsyncMock
+        from app.utils.telegram import safe_query_answer
+
+        query = MagicMock()
+        query.id = "cbq-once-1"
+        query.answer = AsyncMock()
+
+        await safe_query_answer(query)
+        await safe_query_answer(query)
+        assert query.answer.await_count == 1
+
+        # Alerts are still sent
+        await safe_query_answer(query, "Нет доступа", show_alert=True)
+        assert query.answer.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_first_bare_ack_sent_right_after_boot(self):
+        """monotonic() may be below the TTL on a fresh host; first ACK still goes out."""
+        from unittest.mock import AsyncMock, patch
+        from app.utils.telegram import safe_query_answer
+
+        query = MagicMock()
+        query.id = "cbq-boot-1"
+        query.answer = AsyncMock()
+
+        with patch("app.utils.telegram.time.monotonic", return_value=5.0):
+            await safe_query_answer(query)
+        assert query.answer.await_count == 1
+
+
+class TestSafeEditUnchanged:
+    """safe_edit_message skips the Bot API call when nothing would change."""
+
+    def _message(self, text, entities=None, reply_markup=None):
+        from datetime import datetime
+        from aiogram.types import Chat, Message
+        return Message(
+            message_id=1,
+            date=datetime(2026, 1, 1),
+            chat=Chat(id=1, type="private"),
+            text=text,
+            entities=entities,
+            reply_markup=reply_markup,
+        )
+
+    @pytest.mark.asyncio
+    async def test_identical_edit_skipped(self):
+        from aiogram.types import MessageEntity
+        from app.utils.telegram import safe_edit_message
+
+        kb = nlp_report_keyboard("model-1", "abc123")
+        msg = self._message(
+            "Card X",
+            entities=[MessageEntity(type="bold", offset=5, length=1)],
+            reply_markup=kb,
+        )
+        query = MagicMock()
+        query.message = msg
+
+        result = await safe_edit_message(query, "Card <b>X</b>", reply_markup=kb)
+        assert result is msg
+
+    def test_changed_text_or_markup_not_skipped(self):
+        from app.utils.telegram import _is_unchanged
+
+        kb = nlp_report_keyboard("model-1", "abc123")
+        msg = self._message("Card", reply_markup=kb)
+        assert _is_unchanged(msg, "Card", kb, "HTML") is True
+        assert _is_unchanged(msg, "Card 2", kb, "HTML") is False
+        assert _is_unchanged(msg, "Card", nlp_report_keyboard("model-1", "zzz999"), "HTML") is False
+        assert _is_unchanged(msg, "Card", None, "HTML") is False
+
+
 # ============================================================================
 #              DUPLICATE-TAP SUPPRESSION TESTS (_reject_stale)
 # ============================================================================
@@ -170,6 +170,33 @@ class TestStateManagement:
         assert result["step"] == "two"
         assert result["flow"] == "test"
 
+    def test_redis_update_single_round_trip(self):
+        """update() reads once and writes once (no extra lookup inside set)."""
+        fake = FakeAsyncRedis()
+        calls = []
+        orig_get, orig_set = fake.get, fake.set
+
+        async def counting_get(key):
+            calls.append("get")
+            return await orig_get(key)
+
+        async def counting_set(key, value, ex=None):
+            calls.append("set")
+            return await orig_set(key, value, ex=ex)
+
+        fake.get, fake.set = counting_get, counting_set
+        state = RedisMemoryState(
+            redis_url="redis://localhost:6379/0",
+            ttl_seconds=60,
+            redis_client=fake,
+        )
+        state.set(100, 123, {"flow": "test", "prompt_message_id": 7})
+        calls.clear()
+        result = state.update(100, 123, screen_message_id=42)
+        assert calls == ["get", "set"]
+        assert result == {"flow": "test", "prompt_message_id": 7, "screen_message_id": 42}
+        assert state.get(100, 123) == result
+
     def test_missing_state_returns_none(self, state_backend):
         """Non-existent state returns None (not crash)."""
         state = state_backend
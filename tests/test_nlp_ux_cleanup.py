@@ -3,7 +3,11 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.state.memory import MemoryState
 from app.handlers.nlp_callbacks import _handle_back_to_card, handle_nlp_callback
-from app.router.dispatcher import _handle_custom_files_input, _handle_custom_date_input
+from app.router.dispatcher import (
+    _handle_custom_date_input,
+    _handle_custom_files_input,
+    _handle_received_input,
+)
 
 
 def _make_query(user_id=1, data="nlp:bk:model-1"):
@@ -137,3 +141,31 @@ async def test_reset_from_model_card():
         message_id=query.message.message_id,
         reply_markup=None,
     )
+
+
+@pytest.mark.asyncio
+async def test_received_input_edits_screen_before_input_delete():
+    import asyncio
+
+    memory_state = MemoryState()
+    message = _make_message(text="2")
+    message.delete = AsyncMock()
+    config = MagicMock()
+    notion = AsyncMock()
+    user_state = {
+        "flow": "nlp_received",
+        "order_id": "order-1",
+        "count": 5,
+        "current_received": 1,
+        "model_name": "Клещ",
+        "model_id": "model-1",
+        "screen_message_id": 222,
+    }
+
+    with patch("app.router.dispatcher.is_editor", return_value=True):
+        await _handle_received_input(message, "2", user_state, config, notion, memory_state)
+
+    message.bot.edit_message_text.assert_awaited_once()
+    message.delete.assert_not_awaited()
+    await asyncio.sleep(0)
+    message.delete.assert_awaited_once()
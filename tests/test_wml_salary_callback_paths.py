@@ -4,6 +4,8 @@ Complements tests/test_callback_authz.py (which only covers the owner-check
 and lock-rejection short-circuits) — these exercise the actual write logic
 each button performs, previously untested (see [[project_security_review_jul2026]]).
 """
+import asyncio
+import threading
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -129,6 +131,43 @@ class TestWmlAdd:
         assert "додано в Notion" in text
         assert "@cm" in text and "@model" in text
 
+    def test_wml_session_reused_within_thread(self, monkeypatch):
+        sessions = []
+
+        def _fetch(session, *a, **k):
+            sessions.append(session)
+            return _wml_detail()
+
+        monkeypatch.setattr(wml_callbacks, "fetch_profile_by_id", _fetch)
+        wml_callbacks._fetch_profile("u", "p", "1")
+        wml_callbacks._fetch_profile("u", "p", "2")
+        assert len(sessions) == 2
+        assert sessions[0] is sessions[1]
+
+    @pytest.mark.asyncio
+    async def test_stuck_fetch_does_not_block_next_press(self, monkeypatch):
+        started = threading.Event()
+        release = threading.Event()
+
+        def _fetch(session, username, password, wml_id):
+            if wml_id == "1":
+                started.set()
+                release.wait(5)
+            return _wml_detail()
+
+        monkeypatch.setattr(wml_callbacks, "fetch_profile_by_id", _fetch)
+        notion = MagicMock()
+        notion.query_all_models = AsyncMock(return_value=[MagicMock(title="Test Model")])
+        stuck = asyncio.create_task(wml_callbacks.cb_wml_add(_query("wml_add:1"), _config(), notion))
+        try:
+            assert await asyncio.to_thread(started.wait, 2)
+            await asyncio.wait_for(
+                wml_callbacks.cb_wml_add(_query("wml_add:2"), _config(), notion), timeout=2
+            )
+        finally:
+            release.set()
+            await stuck
+
     @pytest.mark.asyncio
     async def test_lock_released_even_on_exception(self, monkeypatch):
         monkeypatch.setattr(wml_callbacks, "fetch_profile_by_id", lambda *a, **k: _wml_detail())